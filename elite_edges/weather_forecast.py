@@ -471,7 +471,7 @@ def build_weather_signal(event_data: dict, confluence: dict,
 # SECTION 5: Main Scanner Function (Bug 4 fix: min 4 sources)
 # ===================================================================
 async def scan_weather_forecasts(poly_markets: list,
-                                 cfg: dict) -> list:
+                                 cfg: dict, ctx: dict | None = None) -> list:
     """
     Main entry point. Called from run_cycle() in main_v2.py.
     Returns list of Opportunity objects for the signal pipeline.
@@ -479,10 +479,10 @@ async def scan_weather_forecasts(poly_markets: list,
     if not cfg.get("weather_forecast", {}).get("enabled", True):
         return []
 
-    from weather_arb.scanner import (get_active_weather_markets,
+    from weather_arb.scanner import (get_weather_markets_cached,
                                      group_weather_markets_by_event)
 
-    weather_markets = get_active_weather_markets(poly_markets)
+    weather_markets = get_weather_markets_cached(poly_markets, ctx)
     if not weather_markets:
         return []
 
@@ -15,6 +15,7 @@ import time
 import signal
 import logging
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from config_loader import load_config
 from cross_platform_scanner import run_full_cross_platform_scan, Opportunity
@@ -110,6 +111,32 @@ logger = logging.getLogger("arb_bot.main")
 # ---------------------------------------------------------------------------
 # Main Loop
 # ---------------------------------------------------------------------------
+# Independent network-bound scans overlap with the cross-platform scan each cycle
+_SCAN_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="scan")
+def _run_whale_scan(cfg: dict, bot_handler) -> list:
+    """Whale convergence scan + vault feed; never raises (runs on _SCAN_POOL)."""
+    try:
+        whale_opps = find_whale_opportunities(cfg)
+        # v3.0: Feed whale trades into vault for persistent scoring
+        if bot_handler and hasattr(bot_handler, 'whale_vault') and bot_handler.whale_vault:
+            try:
+                from whale_tracker import fetch_recent_large_trades
+                trades = fetch_recent_large_trades(cfg)
+                if trades:
+                    bot_handler.whale_vault.record_trades_batch(trades)
+            except Exception:
+                pass
+        return whale_opps
+    except Exception as e:
+        logger.error(f"Whale tracker error: {e}", exc_info=True)
+        return []
+def _run_new_market_scan(cfg: dict, poly_markets: list) -> list:
+    """New market sniper; never raises (runs on _SCAN_POOL)."""
+    try:
+        return find_new_market_opportunities(cfg, existing_markets=poly_markets)
+    except Exception as e:
+        logger.error(f"New market sniper error: {e}", exc_info=True)
+        return []
 def run_cycle(cfg: dict, cycle: int, bot_handler: TelegramBotHandler | None = None) -> list[Opportunity]:
     """
     Main loop iteration:
@@ -124,6 +151,11 @@ def run_cycle(cfg: dict, cycle: int, bot_handler: TelegramBotHandler | None = No
 
     logger.info(f"--- Starting Scan Cycle #{cycle} | {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')}")
     logger.info(f"{'='*60}")
+    # Whale scan doesn't need the market list — run it while the cross-platform scan fetches
+    # Disabled features are skipped here, before any thread handoff or logging
+    whales_enabled = cfg.get("whales", {}).get("enabled", True)
+    new_markets_enabled = cfg.get("new_markets", {}).get("enabled", True)
+    whale_future = _SCAN_POOL.submit(_run_whale_scan, cfg, bot_handler) if whales_enabled else None
     try:
         opportunities, poly_markets = run_full_cross_platform_scan(cfg)
     except Exception as e:
@@ -134,32 +166,20 @@ def run_cycle(cfg: dict, cycle: int, bot_handler: TelegramBotHandler | None = No
 
     # Build combined market list for elite modules
     all_markets = poly_markets  # Kalshi already included in scanner
+    # Per-cycle context: filters shared by several modules are memoized in ctx["cache"]
+    ctx = {"markets": poly_markets, "cache": {}}
     logger.info(
         f"[CYCLE #{cycle} HEALTH] poly_markets={len(poly_markets)} | "
         f"opp_after_scanner={len(opportunities)}"
     )
 
-    # --- Whale Convergence Scan ---
-    try:
-        whale_opps = find_whale_opportunities(cfg)
-        opportunities.extend(whale_opps)
-        # v3.0: Feed whale trades into vault for persistent scoring
-        if bot_handler and hasattr(bot_handler, 'whale_vault') and bot_handler.whale_vault:
-            try:
-                from whale_tracker import fetch_recent_large_trades
-                trades = fetch_recent_large_trades(cfg)
-                if trades:
-                    bot_handler.whale_vault.record_trades_batch(trades)
-            except Exception:
-                pass
-    except Exception as e:
-        logger.error(f"Whale tracker error: {e}", exc_info=True)
-    # --- New Market Sniper ---
-    try:
-        new_market_opps = find_new_market_opportunities(cfg, existing_markets=poly_markets)
-        opportunities.extend(new_market_opps)
-    except Exception as e:
-        logger.error(f"New market sniper error: {e}", exc_info=True)
+    # --- Whale Convergence Scan + New Market Sniper (concurrent, results in original order) ---
+    if new_markets_enabled:
+        new_market_future = _SCAN_POOL.submit(_run_new_market_scan, cfg, poly_markets)
+    if whales_enabled:
+        opportunities.extend(whale_future.result())
+    if new_markets_enabled:
+        opportunities.extend(new_market_future.result())
 
     # --- Elite Edge Modules (v3.0) ---
     # Anti-Hype Detector
@@ -197,7 +217,7 @@ def run_cycle(cfg: dict, cycle: int, bot_handler: TelegramBotHandler | None = No
         try:
             from elite_edges.weather_forecast import scan_weather_forecasts
             import asyncio
-            weather_signals = asyncio.run(scan_weather_forecasts(poly_markets, cfg))
+            weather_signals = asyncio.run(scan_weather_forecasts(poly_markets, cfg, ctx))
             if weather_signals:
                 opportunities.extend(weather_signals)
                 logger.info(f"🌤 Weather Forecast: {len(weather_signals)} signals")
@@ -334,7 +354,7 @@ def run_cycle(cfg: dict, cycle: int, bot_handler: TelegramBotHandler | None = No
                                     )
 
                                 # 2. Scan for new trades
-                                weather_opps = asyncio.run(wa.scan_and_deploy(poly_markets))
+                                weather_opps = asyncio.run(wa.scan_and_deploy(poly_markets, ctx))
                                 if weather_opps:
                                     bot_handler.distribute_signals(weather_opps, cfg)
                                 asyncio.run(wa.update_dashboard())
@@ -550,6 +570,8 @@ def main():
         if whale_vault and time.time() - last_leaderboard_ts > 86400:
             try:
                 whale_vault.merge_leaderboard_data("30d")
+                # Same daily cadence: drop long-idle wallets so the vault stays bounded
+                whale_vault.compact(cfg.get("whale_vault", {}).get("max_age_days", 90))
                 last_leaderboard_ts = time.time()
                 logger.info("🏆 Daily leaderboard refresh complete")
             except Exception as e:
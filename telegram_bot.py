@@ -253,6 +253,36 @@ PAYMENT_CONFIG = {
 def _usdc_available() -> bool:
     """Return True if at least one USDC chain has an address configured."""
     return any(c["addr"] for c in USDC_CHAINS.values())
+TELEGRAM_MAX_CHARS = 4096
+def _opp_key(opp: Opportunity) -> tuple:
+    """
+    Identity used for per-cycle dedup: type, market and every leg's
+    (platform, side), plus the URLs — so two arbs sharing a Polymarket
+    market but matched to different Kalshi markets stay distinct.
+    """
+    market_id = opp.condition_id or opp.market_slug or opp.title
+    legs = tuple((l.get("platform"), l.get("side")) for l in opp.legs)
+    return (opp.opp_type, market_id, legs, tuple(opp.urls))
+def _chunk_messages(msgs: list[str], max_per: int,
+                    overhead: int = 16) -> list[list[int]]:
+    """
+    Group message indices so each chunk holds at most max_per messages
+    and its joined text stays within Telegram's message length limit.
+    overhead reserves room per message for the separator and "#n" prefix.
+    """
+    chunks: list[list[int]] = []
+    cur: list[int] = []
+    size = 0
+    for i, m in enumerate(msgs):
+        extra = len(m) + overhead
+        if cur and (len(cur) >= max_per or size + extra > TELEGRAM_MAX_CHARS):
+            chunks.append(cur)
+            cur, size = [], 0
+        cur.append(i)
+        size += extra
+    if cur:
+        chunks.append(cur)
+    return chunks
 # =========================================================================
 # Interactive Bot Handler
 # =========================================================================
@@ -3213,13 +3243,26 @@ class TelegramBotHandler:
         if not self.enabled or not opportunities:
             return
         min_pct = cfg["telegram"].get("min_alert_profit_pct", 0.5)
-        filtered = [o for o in opportunities if o.profit_pct >= min_pct]
+        # Overlapping scanners can emit the exact same signal twice in one
+        # cycle — keep the first so users get one alert per signal
+        seen_keys: set[tuple] = set()
+        filtered = []
+        for o in opportunities:
+            if o.profit_pct < min_pct:
+                continue
+            key = _opp_key(o)
+            if key in seen_keys:
+                continue
+            seen_keys.add(key)
+            filtered.append(o)
         if not filtered:
             return
         # Store in history (with full structured data for results tracking)
         now = time.time()
+        msg_cache: dict[int, str] = {}
         for opp in filtered:
             msg = format_opportunity(opp)
+            msg_cache[id(opp)] = msg
 
             # v3.0: Record signal in PnL tracker
             if self.pnl_tracker:
@@ -3261,6 +3304,7 @@ class TelegramBotHandler:
         logger.info(
             f"Distributing {len(filtered)} signals to {len(users)} user(s)"
         )
+        per_msg = max(1, cfg["telegram"].get("max_opps_per_message", 10))
         # For each user, filter by signal type + category + dedup + tier
         for chat_id, pref in users.items():
             # Handle both old and new pref format
@@ -3400,12 +3444,28 @@ class TelegramBotHandler:
                 if used_after >= 5:
                     summary += "\n💡 /upgrade for unlimited"
             self._send(chat_id, summary)
-            # Send individual signals (max 10 per user per cycle)
+            # Send signals (max 10 per user per cycle)
             sent_count = 0
-            for i, opp in enumerate(user_opps[:10]):
-                msg = format_opportunity(opp)
-                
-                if tier == "free":
+            if tier != "free":
+                # Paid users: send IMMEDIATELY, several signals per message
+                # so a busy cycle costs a few API calls instead of one each
+                batch = user_opps[:10]
+                msgs = [msg_cache[id(o)] for o in batch]
+                for idx in _chunk_messages(msgs, per_msg):
+                    chunk = [batch[j] for j in idx]
+                    if len(idx) == 1:
+                        text = msgs[idx[0]]
+                    else:
+                        text = "\n\n".join(
+                            f"<b>#{n}</b> {msgs[j]}" for n, j in enumerate(idx, 1)
+                        )
+                    self._send(chat_id, text, self._feedback_keyboard_batch(chunk))
+                    self.signals_sent += len(chunk)
+                    sent_count += len(chunk)
+                    time.sleep(0.5)
+            else:
+                for i, opp in enumerate(user_opps[:10]):
+                    msg = msg_cache[id(opp)]
                     if i == 0:
                         # FIRST signal: send IMMEDIATELY (the hook)
                         msg += (
@@ -3428,13 +3488,6 @@ class TelegramBotHandler:
                         )
                         with self._lock:
                             self.delayed_queue.append((chat_id, msg, release_time))
-                else:
-                    # Paid users: send IMMEDIATELY with feedback buttons
-                    fb_kb = self._feedback_keyboard(opp)
-                    self._send(chat_id, msg, fb_kb)
-                    self.signals_sent += 1
-                    sent_count += 1
-                    time.sleep(0.5)
             # Track signal count for paid users (free first signal tracked above)
             if tier != "free":
                 self._increment_signal_count(chat_id, sent_count)
@@ -3461,6 +3514,21 @@ class TelegramBotHandler:
             ]]
         }
 
+    def _feedback_keyboard_batch(self, opps: list) -> dict:
+        """Vote keyboard for a combined message — one numbered row per signal."""
+        if len(opps) == 1:
+            return self._feedback_keyboard(opps[0])
+        if not self.cfg.get("feedback", {}).get("enabled", True):
+            return {}
+        rows = []
+        for n, opp in enumerate(opps, 1):
+            sig_hash = f"{opp.opp_type}:{opp.title[:30]}"[:50]
+            rows.append([
+                {"text": f"👍 #{n}", "callback_data": f"vote:up:{sig_hash}"},
+                {"text": f"👎 #{n}", "callback_data": f"vote:dn:{sig_hash}"},
+            ])
+        return {"inline_keyboard": rows}
+
     def _handle_vote(self, chat_id: str, vote: str, sig_hash: str):
         """Record a user's vote on a signal."""
         feedback_file = self.cfg.get("feedback", {}).get("file", "feedback.json")
@@ -0,0 +1,106 @@
+import os
+import json
+import sys
+import threading
+import time
+from collections import defaultdict
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import telegram_bot
+from telegram_bot import TelegramBotHandler
+from cross_platform_scanner import Opportunity
+
+telegram_bot.time.sleep = lambda s: None
+
+class FakeBot(TelegramBotHandler):
+    def __init__(self):
+        self.enabled = True
+        self.cfg = {}
+        self.default_chat_id = ""
+        self.user_prefs = {"123": {"signal": "all", "category": "all_cat"}}
+        self._user_seen = {}
+        self.dedup_cooldown = 0
+        self.history = defaultdict(list)
+        self.delayed_queue = []
+        self.signals_sent = 0
+        self.pnl_tracker = None
+        self._lock = threading.RLock()
+        self.sent = []
+
+    def _save_history(self): pass
+    def _get_tier(self, chat_id): return "pro"
+    def _check_signal_limit(self, chat_id): return True, 99
+    def _maybe_send_expiry_reminder(self, chat_id): pass
+    def _increment_signal_count(self, chat_id, n): pass
+    def _send(self, chat_id, text, keyboard=None, **kwargs):
+        self.sent.append(text)
+        return True
+
+def arb(kalshi_ticker, roi):
+    return Opportunity(
+        opp_type="cross_platform_arb",
+        title="Will X happen?",
+        description="",
+        profit_pct=roi,
+        profit_amount=roi,
+        total_cost=0.9,
+        platforms=["polymarket", "kalshi"],
+        legs=[
+            {"platform": "Polymarket", "side": "YES", "price": 0.4},
+            {"platform": "Kalshi", "side": "NO", "price": 0.5},
+        ],
+        urls=["https://polymarket.com/event/x",
+              f"https://kalshi.com/markets/{kalshi_ticker}"],
+        condition_id="0xpoly",
+    )
+
+cfg = {"telegram": {"min_alert_profit_pct": 0.1}, "dedup": {"cooldown_seconds": 0}}
+
+print("\n--- Testing two arbs sharing a Polymarket market ---")
+bot = FakeBot()
+bot.distribute_signals([arb("KXA", 2.0), arb("KXB", 5.0)], cfg)
+kept = bot.history["cross_platform_arb"]
+assert len(kept) == 2, kept
+print("SUCCESS: both cross-platform arbs kept")
+
+print("\n--- Testing an exact repeat ---")
+bot = FakeBot()
+bot.distribute_signals([arb("KXA", 2.0), arb("KXA", 2.0)], cfg)
+kept = bot.history["cross_platform_arb"]
+assert len(kept) == 1, kept
+print("SUCCESS: exact repeat dropped")
+
+import whale_tracker
+
+class FakeResp:
+    status_code = 200
+    headers = {}
+    def __init__(self, rows): self.rows = rows
+    def raise_for_status(self): pass
+    def json(self): return self.rows
+    @property
+    def content(self):
+        return json.dumps(self.rows).encode()
+
+def fill(price, size, outcome="Yes"):
+    return {
+        "timestamp": int(time.time()), "size": size, "price": price, "side": "BUY",
+        "proxyWallet": "0xwhale", "title": "Will X happen?", "eventSlug": "x",
+        "conditionId": "0xpoly", "outcome": outcome, "transactionHash": "0xtx",
+    }
+
+def fetch(rows):
+    whale_tracker._seen_trades.clear()
+    whale_tracker._window.update(max_ts=0, trades=[])
+    whale_tracker._trades_cache.update(etag=None, last_modified=None, trades=[])
+    whale_tracker._SESSION.get = lambda *a, **kw: FakeResp(rows)
+    return whale_tracker.fetch_recent_large_trades({"whales": {"min_trade_size": 1000}})
+
+print("\n--- Testing two fills in one transaction ---")
+trades = fetch([fill(0.40, 5000), fill(0.41, 4000)])
+assert len(trades) == 2, trades
+print("SUCCESS: both fills of one tx kept")
+
+print("\n--- Testing a repeated fill row ---")
+trades = fetch([fill(0.40, 5000), fill(0.40, 5000)])
+assert len(trades) == 1, trades
+print("SUCCESS: repeated fill dropped")
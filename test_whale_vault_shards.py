@@ -0,0 +1,55 @@
+import os
+import sys
+import json
+import tempfile
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+import whale_vault
+from whale_vault import WhaleVault
+
+def legacy_vault(tmp, n=300):
+    """A pre-shard single-file vault with n wallets spread over many prefixes."""
+    path = os.path.join(tmp, "whale_vault.json")
+    wallets = {
+        f"0x{i:04x}{'ab' * 18}": {"pseudonym": f"whale{i}", "total_volume": float(i), "trade_history": []}
+        for i in range(n)
+    }
+    with open(path, "w") as f:
+        json.dump({"wallets": wallets}, f)
+    return path, wallets
+
+print("\n--- Testing legacy file migration round-trip ---")
+with tempfile.TemporaryDirectory() as tmp:
+    path, wallets = legacy_vault(tmp)
+    vault = WhaleVault(path)
+    assert not os.path.exists(path), "legacy file should be retired"
+    assert os.path.isdir(vault.vault_dir)
+    reloaded = WhaleVault(path)
+    assert set(reloaded.wallets) == set(wallets), len(reloaded.wallets)
+    for addr, w in wallets.items():
+        assert reloaded.wallets[addr]["pseudonym"] == w["pseudonym"]
+        assert reloaded.wallets[addr]["total_volume"] == w["total_volume"]
+    print("SUCCESS: every wallet survives migration and reload")
+
+print("\n--- Testing a migration that fails part-way ---")
+with tempfile.TemporaryDirectory() as tmp:
+    path, wallets = legacy_vault(tmp)
+    real_write = whale_vault._write_atomic
+
+    def flaky_write(shard_path, payload):
+        if os.path.basename(shard_path).startswith("00"):
+            raise OSError("disk full")
+        real_write(shard_path, payload)
+
+    whale_vault._write_atomic = flaky_write
+    try:
+        WhaleVault(path)
+    finally:
+        whale_vault._write_atomic = real_write
+    assert os.path.exists(path), "legacy file must be kept after a failed migration"
+    assert os.path.isdir(os.path.join(tmp, "whale_vault_shards"))
+
+    vault = WhaleVault(path)
+    assert set(vault.wallets) == set(wallets), len(vault.wallets)
+    assert not os.path.exists(path), "retried migration should retire the legacy file"
+    assert set(WhaleVault(path).wallets) == set(wallets)
+    print("SUCCESS: wallets from failed shards recovered and migration retried")
@@ -2,12 +2,17 @@
 weather_arb/consensus_scorer.py
 Groups individual model forecasts into discrete probabilistic bins.
 """
+import re
 import logging
 import math
+from functools import lru_cache
 import numpy as np
 
 logger = logging.getLogger("arb_bot.weather.scorer")
 
+_RANGE_RE = re.compile(r'(-?\d+)\s*-\s*(-?\d+)')
+_NUM_RE = re.compile(r'(\d+)')
+
 def construct_bins(center_temp: float, num_bins_each_side: int = 4) -> list[tuple[float, float, str]]:
     """
     Construct 2°F Polymarket bins centered around the given temp.
@@ -35,24 +40,26 @@ def construct_bins(center_temp: float, num_bins_each_side: int = 4) -> list[tupl
         
     return bins
 
+@lru_cache(maxsize=1024)
 def parse_polymarket_bin(bin_title: str) -> tuple[float, float] | None:
-    """Parse '34-35' into (34.0, 35.0), '50+' into (50.0, 200.0), '20-' into (-50.0, 20.0)"""
-    import re
+    """Parse '34-35' into (34.0, 35.0), '50+' into (50.0, 200.0), '20-' into (-50.0, 20.0)
 
+    Memoized: the same handful of bin labels recur across every event and cycle.
+    """
     # Standard range: "34-35"
-    m = re.search(r'(-?\d+)\s*-\s*(-?\d+)', bin_title)
+    m = _RANGE_RE.search(bin_title)
     if m:
         return float(m.group(1)), float(m.group(2))
 
     # "50+" or "50 or higher"
     if bin_title.endswith("+") or "or higher" in bin_title.lower():
-        num = re.search(r'(\d+)', bin_title)
+        num = _NUM_RE.search(bin_title)
         if num:
             return float(num.group(1)), 200.0  # Upper bound very high
 
     # "20-" or "20 or lower"
     if bin_title.endswith("-") or "or lower" in bin_title.lower():
-        num = re.search(r'(\d+)', bin_title)
+        num = _NUM_RE.search(bin_title)
         if num:
             return -50.0, float(num.group(1))  # Lower bound very low
 
@@ -63,49 +70,53 @@ def compute_bin_probs(forecasts: dict[str, float], biases: dict[str, float], tar
     Applies bias correction to each model, produces a blended distribution,
     and integrates the probability density function over the target Polymarket bins.
     """
-    corrected_forecasts = []
-    
-    for model, temp in forecasts.items():
-        if temp is None:
-            continue
-        # Apply standard bias offset
-        bias_offset = biases.get(model, 0.0)
-        corrected = temp + bias_offset
-        corrected_forecasts.append(corrected)
-        
-    if not corrected_forecasts:
-        return {b: 0.0 for b in target_bins}
-        
-    mean_temp = np.mean(corrected_forecasts)
-    
+    corrected_forecasts = [
+        temp + biases.get(model, 0.0)  # Apply standard bias offset
+        for model, temp in forecasts.items()
+        if temp is not None
+    ]
+    probs = bin_probs_from_temps(
+        np.array(corrected_forecasts, dtype=np.float64),
+        [parse_polymarket_bin(b) for b in target_bins],
+    )
+    return dict(zip(target_bins, probs.tolist()))
+
+def bin_probs_from_temps(temps: np.ndarray, bin_bounds: list[tuple[float, float] | None]) -> np.ndarray:
+    """
+    Array form of compute_bin_probs for callers that already hold bias-corrected
+    model temps and parsed bin bounds. Returns probabilities aligned with bin_bounds;
+    unparseable bins (None) get 0.0.
+    """
+    if temps.size == 0:
+        return np.zeros(len(bin_bounds))
+
+    mean_temp = np.mean(temps)
+
     # Dynamic standard deviation based on model disagreement, floor at 1.5°F
-    std_dev = max(1.5, np.std(corrected_forecasts))
-    
-    probs = {}
-    for bin_title in target_bins:
-        bounds = parse_polymarket_bin(bin_title)
+    std_dev = max(1.5, np.std(temps))
+    scale = std_dev * math.sqrt(2.0)
+
+    # CDF of Normal Dist
+    def cdf(v):
+        return (1.0 + math.erf((v - mean_temp) / scale)) / 2.0
+
+    probs = []
+    for bounds in bin_bounds:
         if not bounds:
             # Handle edge cases later ("60 or higher")
-            probs[bin_title] = 0.0
+            probs.append(0.0)
             continue
-            
+
         low, high = bounds
         # Widen bounds slightly to cover the continuous distribution space (e.g. 34-35 covers 33.5 to 35.5)
         # Polymarket resolves to whole integers, so normal distribution mapping should extend +/- 0.5
-        adjusted_low = low - 0.5
-        adjusted_high = high + 0.5
-        
-        # CDF of Normal Dist
-        def cdf(v):
-            return (1.0 + math.erf((v - mean_temp) / (std_dev * math.sqrt(2.0)))) / 2.0
-            
-        prob = cdf(adjusted_high) - cdf(adjusted_low)
-        probs[bin_title] = max(0.001, prob) # Keep a floor probability
-        
+        prob = cdf(high + 0.5) - cdf(low - 0.5)
+        probs.append(max(0.001, prob))  # Keep a floor probability
+
     # Normalize
-    total = sum(probs.values())
+    total = sum(probs)
+    probs = np.array(probs, dtype=np.float64)
     if total > 0:
-        for k in probs:
-            probs[k] /= total
-            
+        probs /= total
+
     return probs
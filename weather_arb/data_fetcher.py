@@ -4,10 +4,15 @@ Fetches multi-model weather forecasts and real-time NWS observations.
 """
 import httpx
 import logging
+from contextlib import nullcontext
 from weather_arb.config import OPENMETEO_BASE, NWS_BASE, NWS_USER_AGENT
 
 logger = logging.getLogger("arb_bot.weather.fetcher")
 
+# Open-Meteo models queried per city, in a fixed order so callers can pack forecasts into arrays
+FORECAST_MODELS = ("gfs_seamless", "ecmwf_ifs04", "icon_seamless")
+_TEMP_KEYS = tuple(f"temperature_2m_max_{m}" for m in FORECAST_MODELS)
+
 # Approximate coordinates for the major target cities
 CITY_COORDS = {
     "NYC": (40.7128, -74.0060),
@@ -19,53 +24,59 @@ CITY_COORDS = {
     "Houston": (29.7604, -95.3698),
 }
 
-async def fetch_open_meteo_forecast(city: str) -> dict[str, float | None]:
+def new_http_client() -> httpx.AsyncClient:
+    """Keep-alive HTTP/2 client to share across a batch of forecast/observation fetches."""
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20, keepalive_expiry=60),
+    )
+
+def _client_or_new(client: httpx.AsyncClient | None):
+    """Use the caller's client as-is, or open (and later close) a one-off client."""
+    return nullcontext(client) if client is not None else new_http_client()
+
+async def fetch_open_meteo_forecast(city: str, client: httpx.AsyncClient | None = None) -> dict[str, float | None]:
     """
     Fetch forecast from multiple models individually.
     Returns: {"gfs_seamless": 34.2, "ecmwf_ifs04": 35.1, "icon_seamless": 33.8}
+    Pass `client` to reuse pooled connections across calls.
     """
     if city not in CITY_COORDS:
         logger.error(f"Unknown city for coords: {city}")
         return {}
 
     lat, lon = CITY_COORDS[city]
-    models = ["gfs_seamless", "ecmwf_ifs04", "icon_seamless"]
     results = {}
 
-    async with httpx.AsyncClient(http2=True) as client:
-        for model in models:
+    async with _client_or_new(client) as client:
+        for model, temp_key in zip(FORECAST_MODELS, _TEMP_KEYS):
+            params = {
+                "latitude": lat,
+                "longitude": lon,
+                "daily": "temperature_2m_max",
+                "models": model,
+                "temperature_unit": "fahrenheit",
+                "timezone": "auto",
+                "forecast_days": 3,
+            }
+            # Only the network round-trip can fail; missing data below is a plain lookup miss
             try:
-                params = {
-                    "latitude": lat,
-                    "longitude": lon,
-                    "daily": "temperature_2m_max",
-                    "models": model,
-                    "temperature_unit": "fahrenheit",
-                    "timezone": "auto",
-                    "forecast_days": 3,
-                }
                 resp = await client.get(
                     f"{OPENMETEO_BASE}/forecast",
                     params=params, timeout=10.0
                 )
                 resp.raise_for_status()
                 data = resp.json()
-
-                # Try model-specific key first, then generic key
-                daily = data.get("daily", {})
-                temps = (
-                    daily.get(f"temperature_2m_max_{model}") or
-                    daily.get("temperature_2m_max") or
-                    []
-                )
-                if temps and temps[0] is not None:
-                    results[model] = temps[0]
-                    logger.debug(f"Open-Meteo {model} for {city}: {temps[0]}°F")
-
             except Exception as e:
                 logger.warning(f"Open-Meteo {model} failed for {city}: {e}")
                 continue
 
+            # Try model-specific key first, then generic key
+            daily = data.get("daily") or {}
+            if (temps := daily.get(temp_key) or daily.get("temperature_2m_max")) and temps[0] is not None:
+                results[model] = temps[0]
+                logger.debug(f"Open-Meteo {model} for {city}: {temps[0]}°F")
+
     if results:
         logger.info(f"Weather forecasts for {city}: {results}")
     else:
@@ -73,12 +84,12 @@ async def fetch_open_meteo_forecast(city: str) -> dict[str, float | None]:
 
     return results
 
-async def fetch_nws_observation(station: str) -> float | None:
+async def fetch_nws_observation(station: str, client: httpx.AsyncClient | None = None) -> float | None:
     """Fetch current observation (in F) for a specific NWS station (e.g., KLGA)."""
     headers = {"User-Agent": NWS_USER_AGENT, "Accept": "application/geo+json"}
     
     try:
-        async with httpx.AsyncClient(http2=True) as client:
+        async with _client_or_new(client) as client:
             resp = await client.get(f"{NWS_BASE}/stations/{station}/observations/latest", headers=headers, timeout=10.0)
             resp.raise_for_status()
             data = resp.json()
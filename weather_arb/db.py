@@ -13,6 +13,9 @@ logger = logging.getLogger("arb_bot.weather.db")
 async def init_db():
     """Initialize the SQLite database with required schemas."""
     async with aiosqlite.connect(WEATHER_DB_PATH) as db:
+        # WAL persists in the file: readers (dashboard) no longer block trade inserts,
+        # and commits append to the log instead of rewriting pages
+        await db.execute("PRAGMA journal_mode=WAL")
         await db.execute('''
             CREATE TABLE IF NOT EXISTS station_bias (
                 city TEXT,
@@ -111,3 +114,21 @@ async def log_trade(market_slug: str, outcome_bin: str, side: str, size: float,
             (now_str, market_slug, outcome_bin, side, size, price, mode, edge)
         )
         await db.commit()
+
+async def log_trades_batch(rows: list[tuple]):
+    """Log a scan's fills in one transaction.
+    rows: (market_slug, outcome_bin, side, size, price, mode, edge) per trade.
+    """
+    if not rows:
+        return
+    now_str = datetime.now(timezone.utc).isoformat()
+    async with aiosqlite.connect(WEATHER_DB_PATH) as db:
+        # Under WAL, NORMAL only syncs at checkpoints — one cheap commit for the whole batch
+        await db.execute("PRAGMA synchronous=NORMAL")
+        await db.executemany(
+            '''INSERT INTO trades 
+               (timestamp, market_slug, outcome_bin, side, size_usdc, entry_price, mode, edge, resolved)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, 0)''',
+            [(now_str, *row) for row in rows]
+        )
+        await db.commit()
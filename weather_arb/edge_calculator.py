@@ -2,6 +2,7 @@
 weather_arb/edge_calculator.py
 Calculates exact bet sizing using Fractional Kelly and constructs betting ladders.
 """
+import numpy as np
 from weather_arb.config import TradingMode, MODE_THRESHOLDS, MODE_KELLY_MULTIPLIER
 
 def calculate_position(market_price: float, model_prob: float, mode: TradingMode, bankroll: float, is_new_launch: bool = False) -> dict | None:
@@ -40,6 +41,13 @@ def calculate_position(market_price: float, model_prob: float, mode: TradingMode
     max_position_pct = 0.10
     final_fraction = min(adjusted_fraction, max_position_pct)
     
+    return size_position(edge, final_fraction, mode, bankroll)
+
+def size_position(edge: float, final_fraction: float, mode: TradingMode, bankroll: float) -> dict | None:
+    """
+    Turns an edge and capped Kelly fraction into a bet against the current bankroll.
+    Returns None if the bet falls below the dynamic minimum.
+    """
     bet_size = bankroll * final_fraction
     
     # Dynamic minimum: $0.25 for small bankrolls, $1.00 for $200+
@@ -54,3 +62,25 @@ def calculate_position(market_price: float, model_prob: float, mode: TradingMode
         "expected_ev": round(bet_size * edge, 2),
         "mode_used": mode.name
     }
+
+def kelly_fractions(prices: np.ndarray, probs: np.ndarray, mode: TradingMode, is_new_launch: bool = False) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized, bankroll-independent half of calculate_position over all bins of an event.
+    Returns (edges, fractions); fraction is 0.0 wherever calculate_position would reject the bin
+    before sizing. Feed non-zero rows to size_position with the live bankroll.
+    """
+    threshold = MODE_THRESHOLDS.get(mode.name, 0.25)
+    if is_new_launch:
+        threshold *= 0.8
+
+    edges = probs - prices
+    valid = (prices > 0.001) & (prices < 0.99) & (edges >= threshold)
+
+    # Same Kelly math as calculate_position; rejected rows get a dummy price to avoid div-by-zero
+    safe_prices = np.where(valid, prices, 0.5)
+    payout = (1.0 / safe_prices) - 1.0
+    kelly = (probs * payout - (1.0 - probs)) / payout
+
+    fractions = np.minimum(kelly * MODE_KELLY_MULTIPLIER.get(mode.name, 0.25), 0.10)
+    fractions = np.where(valid & (kelly > 0), fractions, 0.0)
+    return edges, fractions
@@ -4,6 +4,7 @@ Filters the global Polymarket market list for daily temperature and climate even
 Groups individual sub-markets (YES/NO per bin) into unified event objects.
 """
 import re
+import json
 import logging
 from datetime import datetime, timezone
 
@@ -82,25 +83,25 @@ def get_active_weather_markets(all_poly_markets: list) -> list:
             elif "houston" in title:
                 city_target = "Houston"
 
-            # Extract YES price for grouping
-            prices = m.get("outcome_prices", [])
-            yes_price = 0
+            # Extract YES price for grouping — parsed to float once here so the
+            # trader's edge/obs loops compare floats, never price strings
+            prices = m.get("outcome_prices") or ()
+            yes_price = 0.0
             if prices:
                 try:
-                    yes_price = float(prices[0]) if isinstance(prices[0], (int, float, str)) else 0
+                    yes_price = float(prices[0]) if isinstance(prices[0], (int, float, str)) else 0.0
                 except (ValueError, TypeError):
                     pass
 
-            # Extract CLOB token IDs
-            clob_ids = m.get("clob_token_ids", [])
+            # Extract CLOB token IDs (immutable tuple: indexed and hashed downstream)
+            clob_ids = m.get("clob_token_ids") or ()
             if not clob_ids:
                 raw = m.get("clobTokenIds", "[]")
                 if isinstance(raw, str):
                     try:
-                        import json
                         clob_ids = json.loads(raw)
                     except Exception:
-                        clob_ids = []
+                        clob_ids = ()
                 elif isinstance(raw, list):
                     clob_ids = raw
 
@@ -108,12 +109,24 @@ def get_active_weather_markets(all_poly_markets: list) -> list:
             m["city"] = city_target
             m["is_new_launch"] = is_new
             m["yes_price"] = yes_price
-            m["clob_token_ids"] = clob_ids
+            m["clob_token_ids"] = tuple(clob_ids)
             weather_markets.append(m)
 
     return weather_markets
 
 
+def get_weather_markets_cached(all_poly_markets: list, ctx: dict | None = None) -> list:
+    """get_active_weather_markets, memoized in a cycle context's "cache" so that
+    every weather module in the same cycle shares one pass over the market list.
+    """
+    if ctx is None:
+        return get_active_weather_markets(all_poly_markets)
+    cache = ctx["cache"]
+    if "weather_markets" not in cache:
+        cache["weather_markets"] = get_active_weather_markets(all_poly_markets)
+    return cache["weather_markets"]
+
+
 def group_weather_markets_by_event(weather_markets: list) -> dict:
     """Group individual YES/NO sub-markets into full events.
 
@@ -161,9 +174,9 @@ def group_weather_markets_by_event(weather_markets: list) -> dict:
                 "bins": {},
             }
 
-        clob_ids = m.get("clob_token_ids", [])
+        clob_ids = m.get("clob_token_ids", ())
         grouped[event_key]["bins"][bin_label] = {
-            "yes_price": m.get("yes_price", 0),
+            "yes_price": m.get("yes_price", 0.0),
             "token_id": clob_ids[0] if clob_ids else "",
             "slug": m.get("slug", ""),
             "market_id": m.get("market_id", m.get("condition_id", "")),
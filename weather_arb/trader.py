@@ -8,23 +8,27 @@ import json
 import time
 import logging
 import asyncio
-from datetime import datetime, date, timezone
+import numpy as np
+from datetime import datetime, date
 from dataclasses import dataclass, field, asdict
-from typing import Dict, Any, List
 
-from weather_arb.scanner import get_active_weather_markets, group_weather_markets_by_event
-from weather_arb.data_fetcher import fetch_open_meteo_forecast, fetch_nws_observation
-from weather_arb.edge_calculator import calculate_position
+from weather_arb.scanner import get_weather_markets_cached, group_weather_markets_by_event
+from weather_arb.data_fetcher import FORECAST_MODELS, fetch_open_meteo_forecast, fetch_nws_observation, new_http_client
+from weather_arb.edge_calculator import calculate_position, kelly_fractions, size_position
 from weather_arb.config import TradingMode, CITY_STATIONS
-from weather_arb.consensus_scorer import compute_bin_probs, construct_bins, parse_polymarket_bin
+from weather_arb.consensus_scorer import bin_probs_from_temps, parse_polymarket_bin
+from weather_arb.utils import _ET
 
 logger = logging.getLogger("arb_bot.weather.trader")
 
+# NWS stations update roughly hourly; reuse a reading across cycles for this long
+OBS_CACHE_TTL_SECONDS = 90
+
 
 # ---------------------------------------------------------------------------
 # WeatherSession — Capital Tracking & Compounding
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class WeatherSession:
     initial_capital: float = 39.0
     available_capital: float = 39.0
@@ -42,6 +46,11 @@ class WeatherSession:
         self.available_capital -= amount
         self.total_deployed += amount
 
+    def release(self, amount: float):
+        """Undo a deploy() whose order was never placed."""
+        self.available_capital += amount
+        self.total_deployed -= amount
+
     def resolve_win(self, stake: float, payout: float):
         profit = payout - stake
         reinvest = profit * self.reinvest_rate
@@ -82,11 +91,15 @@ class WeatherSession:
         else:
             return "Phase 4: Cruise ($500+)"
 
-    def save(self, path="weather_session.json"):
+    def save(self, path="weather_session.json", pretty: bool = False):
+        # Saved after every fill — keep compact unless explicitly dumping for a human
         try:
             data = asdict(self)
             with open(path, "w") as f:
-                json.dump(data, f, indent=2, default=str)
+                if pretty:
+                    json.dump(data, f, indent=2, default=str)
+                else:
+                    json.dump(data, f, separators=(",", ":"), default=str)
         except Exception as e:
             logger.error(f"Failed to save weather session: {e}")
 
@@ -113,6 +126,17 @@ def _bin_sort_key(bin_label: str) -> float:
     return float(nums[0]) if nums else 0.0
 
 
+async def _gather_limited(coros, limit: int = 8) -> list:
+    """asyncio.gather with at most `limit` requests in flight (Open-Meteo/NWS rate limits)."""
+    sem = asyncio.Semaphore(limit)
+
+    async def _run(coro):
+        async with sem:
+            return await coro
+
+    return await asyncio.gather(*(_run(c) for c in coros), return_exceptions=True)
+
+
 # ---------------------------------------------------------------------------
 # Main Trader Class
 # ---------------------------------------------------------------------------
@@ -157,10 +181,32 @@ class WeatherArbitrage:
         self._traded_today: set = set()
         self._last_reset_date: date | None = None
 
+        # station → (monotonic fetch time, temp °F)
+        self._obs_cache: dict[str, tuple[float, float]] = {}
+
+        # ClobClient with API creds derived, reused across trades and cycles
+        self._clob_client = None
+
+    # ------------------------------------------------------------------
+    # Mode Specialization
+    # ------------------------------------------------------------------
+    @property
+    def mode(self) -> TradingMode:
+        return self._mode
+
+    @mode.setter
+    def mode(self, value: TradingMode):
+        """Bind mode-specific strategy legs once, not per event (/weather_mode rebinds)."""
+        self._mode = value
+        if value in (TradingMode.NEUTRAL, TradingMode.AGGRESSIVE):
+            self._run_ladder = self._ladder_trades
+        else:
+            self._run_ladder = self._no_ladder
+
     # ------------------------------------------------------------------
     # Core Trading Loop
     # ------------------------------------------------------------------
-    async def scan_and_deploy(self, poly_markets: list) -> list:
+    async def scan_and_deploy(self, poly_markets: list, ctx: dict | None = None) -> list:
         if not self.enabled:
             return []
 
@@ -185,7 +231,7 @@ class WeatherArbitrage:
             self.db_initialized = True
 
         # Scan and group
-        weather_markets = get_active_weather_markets(poly_markets)
+        weather_markets = get_weather_markets_cached(poly_markets, ctx)
         if not weather_markets:
             return []
 
@@ -193,54 +239,105 @@ class WeatherArbitrage:
         if not events:
             return []
 
+        # Only events we can price: known city and at least 3 bins
+        events = {
+            k: e for k, e in events.items()
+            if e["city"] != "Unknown" and len(e["bins"]) >= 3
+        }
+        if not events:
+            return []
+
+        # Afternoon observation window (ET) — same for every event this cycle
+        now_et = datetime.now(_ET)
+        in_obs_window = 12 <= now_et.hour <= 18
+        # Confidence the day's high is already at/above the observed temp grows through the afternoon
+        hour_factor = min(1.0, (now_et.hour - 11) / 7) if in_obs_window else 0.0
+        obs_prob = 0.70 + (0.25 * hour_factor)
+        obs_clock = now_et.strftime('%H:%M')
+
+        # One pooled client per scan: every forecast/observation GET shares keep-alive connections
+        async with new_http_client() as http:
+            # Fetch model forecasts for every city concurrently (one fetch per city)
+            cities = sorted({e["city"] for e in events.values()})
+            results = await _gather_limited(fetch_open_meteo_forecast(c, client=http) for c in cities)
+            forecasts_by_city = {}
+            for c, res in zip(cities, results):
+                if isinstance(res, Exception):
+                    logger.warning(f"Forecast fetch failed for {c}: {res}")
+                elif res:
+                    forecasts_by_city[c] = res
+
+            # Fetch NWS observations once per station, concurrently
+            obs_temps = {}
+            if in_obs_window:
+                stations = sorted({CITY_STATIONS[c] for c in forecasts_by_city if c in CITY_STATIONS})
+                results = await _gather_limited(self._get_observation(st, client=http) for st in stations)
+                for st, res in zip(stations, results):
+                    if isinstance(res, Exception):
+                        logger.warning(f"NWS observation failed for {st}: {res}")
+                    elif res is not None:
+                        obs_temps[st] = res
+
         opportunities = []
+        pending_orders = []  # submitted together after discovery, see _submit_orders
+        obs_edges = []  # "city bin@price" per qualifying obs bin, logged once per scan
 
         for event_key, event in events.items():
             city = event["city"]
-            if city == "Unknown":
-                continue
-
             bins = event["bins"]
-            if len(bins) < 3:  # Need at least 3 bins for meaningful market
-                continue
 
-            # Fetch model forecasts
-            forecasts = await fetch_open_meteo_forecast(city)
+            forecasts = forecasts_by_city.get(city)
             if not forecasts:
                 continue
 
-            # Build sorted bin list and price map
+            # Build sorted bin list and parse each bin's bounds once per event
             bin_labels = sorted(bins.keys(), key=_bin_sort_key)
-            bin_prices = {label: bins[label]["yes_price"] for label in bin_labels}
+            bin_bounds = [parse_polymarket_bin(label) for label in bin_labels]
 
-            # Compute model probabilities for each bin
-            biases = {mod: 0.0 for mod in forecasts}
-            bin_probs = compute_bin_probs(forecasts, biases, bin_labels)
+            # Compute model probabilities for each bin (arrays aligned with FORECAST_MODELS / bin_labels)
+            temps = np.fromiter((forecasts[m] for m in FORECAST_MODELS if m in forecasts), dtype=np.float64)
+            biases = np.zeros_like(temps)
+            probs_arr = bin_probs_from_temps(temps + biases, bin_bounds)
+            best_idx = int(np.argmax(probs_arr))
 
             logger.info(
                 f"Weather {city}: {len(bin_labels)} bins, "
                 f"models={list(forecasts.values())}, "
-                f"top_prob={max(bin_probs.values()):.0%} on {max(bin_probs, key=bin_probs.get)}"
+                f"top_prob={probs_arr[best_idx]:.0%} on {bin_labels[best_idx]}"
             )
 
             # === PRIMARY EDGE DETECTION ===
-            for bin_label in bin_labels:
-                market_price = bin_prices[bin_label]
-                model_prob = bin_probs.get(bin_label, 0.0)
+            # Edge/Kelly for every bin in one vector pass; only bins that clear the mode threshold get sized
+            prices_arr = np.fromiter((bins[b]["yes_price"] for b in bin_labels), dtype=np.float64, count=len(bin_labels))
+
+            # Coarse pass: with the lowest threshold (AGGRESSIVE new launch, 8%) no bin outside this
+            # mask can clear the edge bar, so no-edge events (most of them) skip the Kelly pass entirely
+            reachable = (probs_arr > 0.02) & (prices_arr < 0.95)
+            candidates = ()
+            if reachable.any():
+                edges, fractions = kelly_fractions(
+                    prices_arr, probs_arr, self.mode,
+                    is_new_launch=event.get("is_new_launch", False)
+                )
+                candidates = np.flatnonzero(fractions)
+
+            for i in candidates:
+                bin_label = bin_labels[i]
+                bin_info = bins[bin_label]
+                market_price = bin_info["yes_price"]
 
                 # Skip if already traded today
                 trade_key = f"{event_key}:{bin_label}"
                 if trade_key in self._traded_today:
                     continue
 
-                pos = calculate_position(
-                    market_price, model_prob, self.mode,
-                    self.session.available_capital,
-                    is_new_launch=event.get("is_new_launch", False)
+                # Sized against live capital: earlier orders this scan have already reserved theirs
+                pos = size_position(
+                    float(edges[i]), float(fractions[i]), self.mode,
+                    self.session.available_capital
                 )
 
                 if pos:
-                    bin_info = bins[bin_label]
                     opp = {
                         "platform": "polymarket",
                         "market_id": bin_info["market_id"],
@@ -257,141 +354,194 @@ class WeatherArbitrage:
                     if not self.dry_run and self.exec_engine:
                         pos["token_id"] = bin_info["token_id"]
                         pos["price"] = market_price
-                        success = await self._execute_trade(bin_info["slug"], bin_label, pos)
-                        if success:
-                            self._traded_today.add(trade_key)
-                            self.session.deploy(pos["size_usdc"])
-                            self.session.active_positions.append({
-                                "slug": bin_info["slug"],
-                                "bin": bin_label,
-                                "stake": pos["size_usdc"],
-                                "shares": round(pos["size_usdc"] / pos["price"], 4),
-                                "price": pos["price"],
-                                "token_id": bin_info["token_id"],
-                                "placed_at": time.time(),
-                                "event_key": event_key,
-                            })
-                            self.session.save()
+                        self._queue_order(pending_orders, trade_key, bin_info["slug"], bin_label, pos, {
+                            "slug": bin_info["slug"],
+                            "bin": bin_label,
+                            "stake": pos["size_usdc"],
+                            "shares": round(pos["size_usdc"] / pos["price"], 4),
+                            "price": pos["price"],
+                            "token_id": bin_info["token_id"],
+                            "placed_at": time.time(),
+                            "event_key": event_key,
+                        })
 
             # === LADDER STRATEGY ===
-            if self.mode in (TradingMode.NEUTRAL, TradingMode.AGGRESSIVE):
-                best_bin = max(bin_probs, key=bin_probs.get)
-                best_prob = bin_probs[best_bin]
-
-                if best_prob >= 0.50:
-                    sorted_bins = sorted(bins.keys(), key=_bin_sort_key)
-                    best_idx = sorted_bins.index(best_bin) if best_bin in sorted_bins else -1
-
-                    if best_idx >= 0:
-                        adjacent = []
-                        if best_idx > 0:
-                            adjacent.append(sorted_bins[best_idx - 1])
-                        if best_idx < len(sorted_bins) - 1:
-                            adjacent.append(sorted_bins[best_idx + 1])
-
-                        for adj_bin in adjacent:
-                            adj_price = bin_prices.get(adj_bin, 0)
-                            adj_prob = bin_probs.get(adj_bin, 0)
-                            trade_key = f"{event_key}:{adj_bin}"
-
-                            if trade_key in self._traded_today:
-                                continue
-
-                            adj_edge = adj_prob - adj_price
-                            if adj_edge > 0.05:
-                                adj_amount = min(
-                                    self.session.available_capital * 0.04,
-                                    2.00
-                                )
-                                if adj_amount >= 0.25:
-                                    adj_info = bins[adj_bin]
-                                    opp = {
-                                        "platform": "polymarket",
-                                        "slug": adj_info["slug"],
-                                        "title": f"🔀 Ladder: {city} {adj_bin}°F",
-                                        "type": "WEATHER_LADDER",
-                                        "bin": adj_bin,
-                                        "edge": adj_edge,
-                                        "size": round(adj_amount, 2),
-                                    }
-                                    opportunities.append(opp)
-
-                                    if not self.dry_run and self.exec_engine:
-                                        pos_adj = {
-                                            "token_id": adj_info["token_id"],
-                                            "price": adj_price,
-                                            "size_usdc": round(adj_amount, 2),
-                                            "edge": adj_edge,
-                                            "mode_used": self.mode.name,
-                                        }
-                                        success = await self._execute_trade(adj_info["slug"], adj_bin, pos_adj)
-                                        if success:
-                                            self._traded_today.add(trade_key)
-                                            self.session.deploy(adj_amount)
-                                            self.session.save()
+            opportunities.extend(
+                self._run_ladder(event_key, city, bins, bin_labels, probs_arr, pending_orders)
+            )
 
             # === AFTERNOON OBSERVATION EDGE ===
-            try:
-                import pytz
-                et_tz = pytz.timezone("US/Eastern")
-                now_et = datetime.now(et_tz)
+            station = CITY_STATIONS.get(city) if in_obs_window else None
+            if station:
+                current_temp = obs_temps.get(station)
+
+                if current_temp is not None:
+                    logger.debug("Afternoon obs: %s/%s current=%s°F at %s ET", city, station, current_temp, obs_clock)
+
+                    for bin_label, bounds in zip(bin_labels, bin_bounds):
+                        if not bounds:
+                            continue
+
+                        trade_key = f"{event_key}:{bin_label}:obs"
+                        if trade_key in self._traded_today:
+                            continue
+
+                        low, high = bounds
+                        bin_info = bins[bin_label]
+                        market_price = bin_info["yes_price"]
+
+                        if current_temp >= low - 0.5 and market_price < 0.60:
+                            obs_pos = calculate_position(
+                                market_price, obs_prob, self.mode,
+                                self.session.available_capital,
+                                is_new_launch=False
+                            )
+                            if obs_pos:
+                                opp = {
+                                    "platform": "polymarket",
+                                    "slug": bin_info["slug"],
+                                    "title": f"🌡 OBS: {city} {bin_label}°F (now: {current_temp}°F)",
+                                    "type": "WEATHER_OBS",
+                                    "bin": bin_label,
+                                    "edge": obs_pos["edge"],
+                                    "size": obs_pos["size_usdc"],
+                                }
+                                opportunities.append(opp)
+
+                                if not self.dry_run and self.exec_engine:
+                                    obs_pos["token_id"] = bin_info["token_id"]
+                                    obs_pos["price"] = market_price
+                                    self._queue_order(pending_orders, trade_key, bin_info["slug"], bin_label, obs_pos)
+
+                                obs_edges.append(f"{city} {bin_label}@{market_price:.2f}")
+                                logger.debug(
+                                    "OBS EDGE: %s current=%s°F, bin=%s @ %.2f, obs_prob=%.0f%%, edge=%.0f%%",
+                                    city, current_temp, bin_label, market_price,
+                                    obs_prob * 100, obs_pos["edge"] * 100,
+                                )
+
+        if obs_edges:
+            logger.info("OBS edges this scan (%d, obs_prob=%.0f%% at %s ET): %s",
+                        len(obs_edges), obs_prob * 100, obs_clock, ", ".join(obs_edges))
 
-                if 12 <= now_et.hour <= 18 and city in CITY_STATIONS:
-                    station = CITY_STATIONS[city]
-                    current_temp = await fetch_nws_observation(station)
+        if pending_orders:
+            await self._submit_orders(pending_orders)
 
-                    if current_temp is not None:
-                        logger.info(f"Afternoon obs: {city}/{station} current={current_temp}°F at {now_et.strftime('%H:%M')} ET")
+        return opportunities
 
-                        for bin_label, bin_info in bins.items():
-                            trade_key = f"{event_key}:{bin_label}:obs"
-                            if trade_key in self._traded_today:
-                                continue
+    # ------------------------------------------------------------------
+    # Order Batching
+    # ------------------------------------------------------------------
+    def _queue_order(self, pending: list, trade_key: str, slug: str, bin_label: str,
+                     pos: dict, position: dict | None = None):
+        """Claim the trade key and reserve capital now so later sizing and dedup see this order."""
+        self._traded_today.add(trade_key)
+        self.session.deploy(pos["size_usdc"])
+        pending.append((trade_key, slug, bin_label, pos, position))
+
+    async def _submit_orders(self, pending: list):
+        """Place all queued orders concurrently; release the reservation of any that fail.
+        Fills are logged to SQLite in one batch once every order has settled.
+        """
+        results = await asyncio.gather(
+            *(self._execute_trade(slug, bin_label, pos) for _, slug, bin_label, pos, _ in pending),
+            return_exceptions=True,
+        )
+        fills = []
+        for (trade_key, slug, bin_label, pos, position), ok in zip(pending, results):
+            if ok is True:
+                if position:
+                    self.session.active_positions.append(position)
+                fills.append((
+                    slug, bin_label, "BUY", pos["size_usdc"], pos["price"],
+                    pos.get("mode_used", self.mode.name), pos["edge"],
+                ))
+                continue
+            if isinstance(ok, BaseException):
+                logger.error(f"Weather order {slug} [{bin_label}] raised: {ok}")
+            self._traded_today.discard(trade_key)
+            self.session.release(pos["size_usdc"])
+        self.session.save()
 
-                            bounds = parse_polymarket_bin(bin_label)
-                            if not bounds:
-                                continue
+        try:
+            from weather_arb.db import log_trades_batch
+            await log_trades_batch(fills)
+        except Exception:
+            pass  # DB logging is best-effort
+
+    async def _get_observation(self, station: str, client=None) -> float | None:
+        """Current NWS temperature for a station, cached for OBS_CACHE_TTL_SECONDS."""
+        now = time.monotonic()
+        hit = self._obs_cache.get(station)
+        if hit and now - hit[0] < OBS_CACHE_TTL_SECONDS:
+            return hit[1]
+
+        temp = await fetch_nws_observation(station, client=client)
+        if temp is not None:
+            self._obs_cache[station] = (now, temp)
+        return temp
 
-                            low, high = bounds
-                            market_price = bin_info["yes_price"]
+    # ------------------------------------------------------------------
+    # Ladder Strategy (NEUTRAL / AGGRESSIVE only)
+    # ------------------------------------------------------------------
+    def _no_ladder(self, *args) -> list:
+        return []
 
-                            if current_temp >= low - 0.5 and market_price < 0.60:
-                                hour_factor = min(1.0, (now_et.hour - 11) / 7)
-                                obs_prob = 0.70 + (0.25 * hour_factor)
+    def _ladder_trades(self, event_key: str, city: str, bins: dict,
+                       bin_labels: list, probs_arr: np.ndarray, pending_orders: list) -> list:
+        """Stake small amounts on the bins adjacent to a high-conviction best bin."""
+        opportunities = []
+        best_idx = int(np.argmax(probs_arr))
+        if probs_arr[best_idx] < 0.50:
+            return opportunities
+
+        adjacent = []
+        if best_idx > 0:
+            adjacent.append(best_idx - 1)
+        if best_idx < len(bin_labels) - 1:
+            adjacent.append(best_idx + 1)
+
+        for j in adjacent:
+            adj_bin = bin_labels[j]
+            adj_info = bins[adj_bin]
+            adj_price = adj_info["yes_price"]
+            adj_prob = float(probs_arr[j])
+            trade_key = f"{event_key}:{adj_bin}"
+
+            if trade_key in self._traded_today:
+                continue
 
-                                obs_pos = calculate_position(
-                                    market_price, obs_prob, self.mode,
-                                    self.session.available_capital,
-                                    is_new_launch=False
-                                )
-                                if obs_pos:
-                                    opp = {
-                                        "platform": "polymarket",
-                                        "slug": bin_info["slug"],
-                                        "title": f"🌡 OBS: {city} {bin_label}°F (now: {current_temp}°F)",
-                                        "type": "WEATHER_OBS",
-                                        "bin": bin_label,
-                                        "edge": obs_pos["edge"],
-                                        "size": obs_pos["size_usdc"],
-                                    }
-                                    opportunities.append(opp)
-
-                                    if not self.dry_run and self.exec_engine:
-                                        obs_pos["token_id"] = bin_info["token_id"]
-                                        obs_pos["price"] = market_price
-                                        success = await self._execute_trade(bin_info["slug"], bin_label, obs_pos)
-                                        if success:
-                                            self._traded_today.add(trade_key)
-                                            self.session.deploy(obs_pos["size_usdc"])
-                                            self.session.save()
-
-                                    logger.info(
-                                        f"OBS EDGE: {city} current={current_temp}°F, "
-                                        f"bin={bin_label} @ {market_price:.2f}, "
-                                        f"obs_prob={obs_prob:.0%}, edge={obs_pos['edge']:.0%}"
-                                    )
-            except ImportError:
-                pass  # pytz not installed
+            adj_edge = adj_prob - adj_price
+            if adj_edge <= 0.05:
+                continue
+
+            adj_amount = min(
+                self.session.available_capital * 0.04,
+                2.00
+            )
+            if adj_amount < 0.25:
+                continue
+
+            opp = {
+                "platform": "polymarket",
+                "slug": adj_info["slug"],
+                "title": f"🔀 Ladder: {city} {adj_bin}°F",
+                "type": "WEATHER_LADDER",
+                "bin": adj_bin,
+                "edge": adj_edge,
+                "size": round(adj_amount, 2),
+            }
+            opportunities.append(opp)
+
+            if not self.dry_run and self.exec_engine:
+                pos_adj = {
+                    "token_id": adj_info["token_id"],
+                    "price": adj_price,
+                    "size_usdc": round(adj_amount, 2),
+                    "edge": adj_edge,
+                    "mode_used": self.mode.name,
+                }
+                self._queue_order(pending_orders, trade_key, adj_info["slug"], adj_bin, pos_adj)
 
         return opportunities
 
@@ -481,17 +631,11 @@ class WeatherArbitrage:
         logger.info(f"Executing weather trade on {slug} [{bin_title}] for ${pos['size_usdc']} (Edge: {pos['edge']:.2f})")
 
         try:
-            admin_id = getattr(self.exec_engine, "_admin_chat_id", "")
-            client = self.exec_engine._get_client(admin_id) if admin_id else None
-
+            client = self._get_clob_client()
             if not client:
                 logger.error("No valid ClobClient found.")
                 return False
 
-            # Ensure API creds are set
-            if not getattr(client, 'api_creds', None):
-                client.set_api_creds(client.derive_api_key())
-
             from py_clob_client.order_builder.constants import BUY
             shares = pos['size_usdc'] / pos['price']
 
@@ -502,25 +646,33 @@ class WeatherArbitrage:
                 side=BUY,
             )
 
-            resp = client.post_order(order)
+            # post_order is a blocking HTTPS call — run it off the loop so batched orders overlap
+            resp = await asyncio.to_thread(client.post_order, order)
             logger.info(f"Weather Order Placed: {resp}")
-
-            try:
-                from weather_arb.db import log_trade
-                await log_trade(
-                    market_slug=slug, outcome_bin=bin_title,
-                    side="BUY", size=pos['size_usdc'],
-                    price=pos['price'], mode=pos.get('mode_used', self.mode.name),
-                    edge=pos['edge']
-                )
-            except Exception:
-                pass  # DB logging is best-effort
-            return True
+            return True  # logged to SQLite by _submit_orders with the rest of the batch
 
         except Exception as e:
             logger.error(f"Failed to execute weather trade: {e}", exc_info=True)
+            # Only an auth rejection means the creds went stale; ordinary order
+            # failures keep the client so the next trade skips derive_api_key()
+            if getattr(e, "status_code", None) in (401, 403):
+                self._clob_client = None
             return False
 
+    def _get_clob_client(self):
+        """Admin ClobClient with API creds set, built once instead of per trade."""
+        if self._clob_client is None:
+            admin_id = getattr(self.exec_engine, "_admin_chat_id", "")
+            client = self.exec_engine._get_client(admin_id) if admin_id else None
+            if not client:
+                return None
+
+            # derive_api_key() is a signed HTTPS round-trip — only when creds are missing
+            if not getattr(client, 'creds', None):
+                client.set_api_creds(client.derive_api_key())
+            self._clob_client = client
+        return self._clob_client
+
     async def update_dashboard(self):
         """Hook to trigger daily SQLite digest and PNL aggregation."""
         pass
@@ -3,19 +3,20 @@ weather_arb/utils.py
 Helper functions for timezone conversions, logging, etc.
 """
 import logging
-from datetime import datetime
-import pytz
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
 
 logger = logging.getLogger("arb_bot.weather")
 
+_ET = ZoneInfo("America/New_York")
+
 def get_et_now() -> datetime:
     """Returns current datetime in Eastern Time."""
-    utc_now = datetime.utcnow().replace(tzinfo=pytz.utc)
-    return utc_now.astimezone(pytz.timezone("US/Eastern"))
+    return datetime.now(_ET)
 
 def get_utc_now() -> datetime:
     """Returns current datetime in UTC."""
-    return datetime.utcnow().replace(tzinfo=pytz.utc)
+    return datetime.now(timezone.utc)
 
 def is_same_day(dt1: datetime, dt2: datetime) -> bool:
     """Checks if two datetimes are the same calendar day in their respective timezones."""
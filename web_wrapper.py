@@ -3,13 +3,16 @@ web_wrapper.py — Wraps the bot in a tiny web server for Render's free Web Serv
 The bot runs in a background thread while a simple HTTP server keeps Render happy.
 """
 import threading
+import signal
 import time
 import os
 import logging
 import traceback
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from dataclasses import dataclass
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 logger = logging.getLogger("arb_bot.wrapper")
-# Bot status (shared between threads)
+# Bot status (shared between threads). Never mutated in place: writers go through
+# _publish, which rebinds a fresh dict, so a reader holding one reference sees one version.
 bot_status = {
     "started": time.time(),
     "cycles": 0,
@@ -19,34 +22,70 @@ bot_status = {
     "last_error": "",
     "name": "Polymarket Arb Bot",
 }
+_status_lock = threading.Lock()
+def _publish(**delta):
+    """Copy-on-publish update of bot_status."""
+    global bot_status
+    with _status_lock:
+        new_status = dict(bot_status)
+        new_status.update(delta)
+        bot_status = new_status
+# Set on shutdown; the bot loop waits on it instead of sleeping so it exits promptly
+_stop = threading.Event()
+# Status page, encoded once at import; do_GET only fills in the live values
+_STATUS_PAGE = """
+        <html><body style="font-family:monospace; padding:20px; background:#1a1a2e; color:#e0e0e0;">
+        <h2>🤖 %s</h2>
+        <p>Status: <b style="color:%s;">
+            %s</b></p>
+        <p>Uptime: %dh %dm</p>
+        <p>Scan cycles: %d</p>
+        <p>Last scan: %s</p>
+        <p>Opportunities found: %d</p>
+        %s
+        </body></html>
+        """.encode()
+_STATUS_RUNNING = (b"#00ff88", b"RUNNING")
+_STATUS_ERROR = (b"#ff6666", "ERROR — RESTARTING".encode())
+# (monotonic build time, body): bursts of pings within a second share one render
+_STATUS_TTL = 1.0
+_status_cache = (float("-inf"), b"")
+def _render_status() -> bytes:
+    s = bot_status  # One snapshot for every field below
+    uptime = int(time.time() - s["started"])
+    hours = uptime // 3600
+    minutes = (uptime % 3600) // 60
+    error_html = b""
+    if s["last_error"]:
+        error_html = (
+            b'<p style="color:#ff6666;">Last error: %s</p>'
+            % s["last_error"][:500].encode()
+        )
+    color, label = _STATUS_RUNNING if s["bot_alive"] else _STATUS_ERROR
+    return _STATUS_PAGE % (
+        s["name"].encode(), color, label,
+        hours, minutes,
+        s["cycles"],
+        s["last_scan"].encode(),
+        s["opportunities_found"],
+        error_html,
+    )
 class StatusHandler(BaseHTTPRequestHandler):
     """Simple HTTP handler that shows bot status."""
+    # Buffer wfile (default is unbuffered) so headers + body leave in one send on the per-request flush
+    wbufsize = -1
     def do_GET(self):
-        uptime = int(time.time() - bot_status["started"])
-        hours = uptime // 3600
-        minutes = (uptime % 3600) // 60
-        error_html = ""
-        if bot_status["last_error"]:
-            error_html = (
-                f'<p style="color:#ff6666;">Last error: '
-                f'{bot_status["last_error"][:500]}</p>'
-            )
-        html = f"""
-        <html><body style="font-family:monospace; padding:20px; background:#1a1a2e; color:#e0e0e0;">
-        <h2>🤖 {bot_status['name']}</h2>
-        <p>Status: <b style="color:{'#00ff88' if bot_status['bot_alive'] else '#ff6666'};">
-            {'RUNNING' if bot_status['bot_alive'] else 'ERROR — RESTARTING'}</b></p>
-        <p>Uptime: {hours}h {minutes}m</p>
-        <p>Scan cycles: {bot_status['cycles']}</p>
-        <p>Last scan: {bot_status['last_scan']}</p>
-        <p>Opportunities found: {bot_status['opportunities_found']}</p>
-        {error_html}
-        </body></html>
-        """
+        global _status_cache
+        now = time.monotonic()
+        built_at, body = _status_cache
+        if now - built_at >= _STATUS_TTL:
+            body = _render_status()
+            _status_cache = (now, body)  # Rebound as one tuple, so readers never see a torn pair
         self.send_response(200)
         self.send_header("Content-Type", "text/html")
+        self.send_header("Content-Length", str(len(body)))
         self.end_headers()
-        self.wfile.write(html.encode())
+        self.wfile.write(body)
     def do_HEAD(self):
         """Handle HEAD requests (used by UptimeRobot)."""
         self.send_response(200)
@@ -54,21 +93,29 @@ class StatusHandler(BaseHTTPRequestHandler):
         self.end_headers()
     def log_message(self, format, *args):
         pass  # Suppress request logs
-def run_bot():
-    """Run the main bot loop. Called in a background thread."""
-    from datetime import datetime, timezone
+class StatusServer(ThreadingHTTPServer):
+    """One thread per request, so a slow keep-alive health check can't block the next."""
+    daemon_threads = True
+    allow_reuse_address = True
+    allow_reuse_port = True  # SO_REUSEPORT: a redeploy can bind while the old socket lingers
+@dataclass
+class BotState:
+    """Everything run_bot sets up once; survives loop restarts after a crash."""
+    cfg: dict
+    bot_handler: object
+    interval: float
+    cycle: int = 0
+def initialize() -> BotState:
+    """One-time bot setup: config, startup alert, engines, Telegram polling."""
     from config_loader import load_config
-    from main_v2 import run_cycle, setup_logging
+    from main_v2 import setup_logging
     from telegram_bot import TelegramBotHandler
-    from telegram_alerts_v2 import (
-        send_startup_message,
-        send_no_opportunities_message,
-    )
+    from telegram_alerts_v2 import send_startup_message
     
     cfg = load_config("config.yaml")
     
     # Update status name
-    bot_status["name"] = cfg["telegram"].get("bot_name", "PocketMoney")
+    _publish(name=cfg["telegram"].get("bot_name", "PocketMoney"))
     # Add defaults
     cfg.setdefault("cross_platform", {"min_profit_pct": 1.0, "similarity_threshold": 0.60})
     cfg.setdefault("bonds", {"min_price": 0.93, "min_roi_pct": 0.5})
@@ -155,50 +202,75 @@ def run_bot():
     bot_handler.start_polling()
     log.info("Interactive signal selector active")
     
-    cycle = 0
-    interval = cfg["scanner"]["interval_seconds"]
+    return BotState(cfg, bot_handler, cfg["scanner"]["interval_seconds"])
+def loop_cycles(state: BotState):
+    """Run scan cycles until shutdown. Called in a background thread."""
+    from datetime import datetime, timezone
+    from main_v2 import run_cycle
+    from telegram_alerts_v2 import send_no_opportunities_message
     
-    while True:
-        cycle += 1
-        bot_status["cycles"] = cycle
-        bot_status["last_scan"] = datetime.now(timezone.utc).strftime(
-            "%Y-%m-%d %H:%M:%S UTC"
+    log = logging.getLogger("arb_bot.main")
+    cfg, bot_handler, interval = state.cfg, state.bot_handler, state.interval
+    max_interval = cfg["scanner"].get("max_interval_seconds", interval * 8)
+    quiet_cycles = 0
+    next_tick = time.monotonic()
+    
+    while not _stop.is_set():
+        state.cycle += 1
+        cycle = state.cycle
+        _publish(
+            cycles=cycle,
+            last_scan=datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC"),
+            bot_alive=True,
         )
-        bot_status["bot_alive"] = True
         
         try:
             # RUN THE REAL CYCLE FROM MAIN_V2 WHICH INCLUDES BOND SPREADER
             opportunities = run_cycle(cfg, cycle, bot_handler)
-            bot_status["opportunities_found"] += len(opportunities)
+            _publish(opportunities_found=bot_status["opportunities_found"] + len(opportunities))
             
             if opportunities:
                 log.info(f"🚨 {len(opportunities)} opportunities found — distributing!")
                 bot_handler.distribute_signals(opportunities, cfg)
+                quiet_cycles = 0
             else:
                 send_no_opportunities_message(cycle, cfg)
+                quiet_cycles = min(quiet_cycles + 1, 10)
                 
         except Exception as e:
             log.error(f"Cycle error: {e}", exc_info=True)
-            bot_status["last_error"] = f"Cycle: {str(e)[:200]}"
+            _publish(last_error=f"Cycle: {str(e)[:200]}")
             
-        time.sleep(interval)
+        # Deadline scheduling: the next cycle starts `sleep_for`s after this one started,
+        # regardless of cycle runtime. Quiet streaks back off exponentially (capped); a hit resets.
+        sleep_for = min(interval * (2 ** quiet_cycles), max_interval)
+        next_tick += sleep_for
+        delay = next_tick - time.monotonic()
+        if delay > 0:
+            _stop.wait(delay)
+        else:
+            log.warning(f"Cycle #{cycle} overran interval by {-delay:.1f}s")
+            next_tick = time.monotonic()
 def _run_bot_safe():
     """
-    Wrapper that catches ANY crash in run_bot() and keeps retrying.
+    Wrapper that catches ANY crash in the bot thread and keeps retrying.
     Without this, a daemon thread crash = silent death, bot stops
     responding to commands forever while the web server stays up.
+    Setup runs until it succeeds once; after that only the cycle loop restarts.
     """
-    while True:
+    state = None
+    while not _stop.is_set():
         try:
-            run_bot()
+            if state is None:
+                state = initialize()
+            loop_cycles(state)
         except Exception as e:
-            bot_status["bot_alive"] = False
-            bot_status["last_error"] = f"CRASH: {str(e)[:300]}"
+            _publish(bot_alive=False, last_error=f"CRASH: {str(e)[:300]}")
             logger.critical(
                 f"Bot thread crashed! Restarting in 30s...\n"
                 f"{traceback.format_exc()}"
             )
-            time.sleep(30)  # Wait before restart
+            _stop.wait(30)  # Wait before restart
 def main():
     # Setup basic logging for the wrapper itself
     logging.basicConfig(
@@ -212,8 +284,18 @@ def main():
     print("🤖 Bot thread started")
     # Start web server in main thread
     port = int(os.environ.get("PORT", 10000))
-    server = HTTPServer(("0.0.0.0", port), StatusHandler)
+    server = StatusServer(("0.0.0.0", port), StatusHandler)
     print(f"🌐 Web server running on port {port}")
-    server.serve_forever()
+
+    def _handle_sigterm(signum, frame):
+        raise KeyboardInterrupt  # Render sends SIGTERM on redeploy
+    signal.signal(signal.SIGTERM, _handle_sigterm)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Shutdown signal received...")
+    finally:
+        _stop.set()
+        server.server_close()
 if __name__ == "__main__":
     main()
@@ -9,11 +9,20 @@ it's a strong directional signal worth following.
 Data Source: https://data-api.polymarket.com/trades (no auth required)
 """
 import time
+import atexit
+from itertools import chain
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timezone, timedelta
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from cross_platform_scanner import Opportunity
+# Fast JSON decode for the ~1000-record trades payload — graceful fallback to stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger("arb_bot.whale_tracker")
 
@@ -23,20 +32,59 @@ logger = logging.getLogger("arb_bot.whale_tracker")
 
 DATA_API_TRADES_URL = "https://data-api.polymarket.com/trades"
 
+# Keep-alive session shared across cycles: skips the TCP+TLS handshake on every poll
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+))
+_SESSION.headers.update({
+    "Accept": "application/json",
+    "Connection": "keep-alive",
+    "User-Agent": "arb-bot/2.0",
+})
+atexit.register(_SESSION.close)
+
+# Validators + decoded body of the last 200 response, for conditional GETs
+_trades_cache = {"etag": None, "last_modified": None, "trades": []}
+
+# Incremental cursor: large trades parsed on earlier polls (newest first) and the
+# newest unix timestamp seen so far
+_window = {"max_ts": 0, "trades": []}
+
+# Identity keys of large trades already ingested (oldest first), bounded so a
+# long-running bot doesn't grow it forever. Catches rows the API repeats within a
+# page or across overlapping polls before they inflate convergence counts.
+SEEN_TRADES_MAX = 10_000
+_seen_trades: OrderedDict = OrderedDict()
+
 
 def fetch_recent_large_trades(cfg: dict) -> list[dict]:
     """
     Fetch recent trades from Polymarket's public Data API.
     Filters for trades above the minimum size threshold.
-    Returns list of trade dicts with: market, side, size, maker, timestamp, etc.
+    Returns list of trade dicts with: market, side, size, maker, ts (unix seconds), etc.
     """
+    return _fetch_large_trades(cfg)[0]
+
+
+def fetch_grouped_large_trades(cfg: dict) -> dict[tuple, list[dict]]:
+    """Same trades as fetch_recent_large_trades, bucketed by (market_id, side)
+    as they are collected — the form detect_whale_convergence works on."""
+    return _fetch_large_trades(cfg)[1]
+
+
+def _fetch_large_trades(cfg: dict) -> tuple[list[dict], dict[tuple, list[dict]]]:
+    """Flat (newest first) and (market_id, side)-grouped views of the same large trades."""
     whale_cfg = cfg.get("whales", {})
     min_size = whale_cfg.get("min_trade_size", 1000)
     lookback_min = whale_cfg.get("lookback_minutes", 120)
 
     cutoff = datetime.now(timezone.utc) - timedelta(minutes=lookback_min)
-    cutoff_ts = int(cutoff.timestamp())
+    cutoff_ts = cutoff.timestamp()
     large_trades = []
+    grouped: dict[tuple, list[dict]] = defaultdict(list)
 
     try:
         # The Data API returns trades in reverse chronological order
@@ -44,20 +92,50 @@ def fetch_recent_large_trades(cfg: dict) -> list[dict]:
         params = {
             "limit": 1000,
         }
-        resp = requests.get(
+        headers = {}
+        if _trades_cache["etag"]:
+            headers["If-None-Match"] = _trades_cache["etag"]
+        if _trades_cache["last_modified"]:
+            headers["If-Modified-Since"] = _trades_cache["last_modified"]
+        resp = _SESSION.get(
             DATA_API_TRADES_URL,
             params=params,
             timeout=20,
-            headers={"Accept": "application/json"},
+            headers=headers,
         )
-        resp.raise_for_status()
-        trades = resp.json()
 
-        if not isinstance(trades, list):
-            trades = trades.get("data", trades.get("trades", []))
+        if resp.status_code == 304:
+            # Tail unchanged — reuse the last decoded list (the cursor below skips all of it)
+            trades = _trades_cache["trades"]
+        else:
+            resp.raise_for_status()
+            trades = orjson.loads(resp.content) if orjson else resp.json()
+
+            if not isinstance(trades, list):
+                trades = trades.get("data", trades.get("trades", []))
+
+            _trades_cache["etag"] = resp.headers.get("ETag")
+            _trades_cache["last_modified"] = resp.headers.get("Last-Modified")
+            _trades_cache["trades"] = trades
+
+        # Only the delta since the last poll is parsed; older trades come from _window
+        last_max_ts = newest_ts = _window["max_ts"]
+        new_trades = []
 
         for trade in trades:
             try:
+                # Parse timestamp (unix seconds)
+                ts = trade.get("timestamp", 0)
+                if not isinstance(ts, (int, float)):
+                    continue
+                if ts < last_max_ts:
+                    break  # Reverse chronological: the rest was handled by an earlier poll
+                if ts > newest_ts:
+                    newest_ts = ts
+                if ts < cutoff_ts:
+                    break  # Older than the lookback, and so is everything after it
+
+                # Cheap numeric filters first; only survivors pay for dict construction
                 size = float(trade.get("size", 0))
                 price = float(trade.get("price", 0))
                 trade_value = size * price  # Total USDC value
@@ -65,16 +143,6 @@ def fetch_recent_large_trades(cfg: dict) -> list[dict]:
                 if trade_value < min_size:
                     continue
 
-                # Parse timestamp (unix seconds)
-                ts = trade.get("timestamp", 0)
-                if isinstance(ts, (int, float)):
-                    trade_time = datetime.fromtimestamp(ts, tz=timezone.utc)
-                else:
-                    continue
-
-                if trade_time < cutoff:
-                    continue
-
                 # Determine side
                 side = trade.get("side", "BUY").upper()
 
@@ -86,7 +154,20 @@ def fetch_recent_large_trades(cfg: dict) -> list[dict]:
                 outcome = trade.get("outcome", side)
                 pseudonym = trade.get("pseudonym", "")
 
-                large_trades.append({
+                # One row per fill: a tx can match one wallet against several makers
+                # (different price/size) or both outcomes, so the hash alone isn't enough
+                tx_hash = trade.get("transactionHash")
+                key = (
+                    (condition_id, tx_hash, wallet, outcome, side, size, price) if tx_hash
+                    else (wallet, condition_id, side, ts, size, price)
+                )
+                if key in _seen_trades:
+                    continue
+                _seen_trades[key] = None
+                if len(_seen_trades) > SEEN_TRADES_MAX:
+                    _seen_trades.popitem(last=False)
+
+                new_trades.append({
                     "market_id": condition_id,
                     "title": title,
                     "event_slug": event_slug,
@@ -98,13 +179,23 @@ def fetch_recent_large_trades(cfg: dict) -> list[dict]:
                     "value": trade_value,
                     "maker": wallet,
                     "pseudonym": pseudonym,
-                    "timestamp": trade_time,
+                    "ts": ts,
                 })
 
             except (ValueError, TypeError, KeyError) as e:
                 logger.debug(f"Skipping trade: {e}")
                 continue
 
+        # Merge the delta with still-fresh trades from earlier polls; the same pass
+        # buckets by (market, side)
+        for t in chain(new_trades, _window["trades"]):
+            if t["ts"] < cutoff_ts or t["value"] < min_size:
+                continue
+            large_trades.append(t)
+            grouped[(t["market_id"], t["side"])].append(t)
+        _window["trades"] = large_trades
+        _window["max_ts"] = newest_ts
+
         logger.info(
             f"Fetched {len(large_trades)} large trades "
             f"(≥${min_size}) in last {lookback_min} min"
@@ -115,7 +206,7 @@ def fetch_recent_large_trades(cfg: dict) -> list[dict]:
     except Exception as e:
         logger.error(f"Whale tracker fetch error: {e}", exc_info=True)
 
-    return large_trades
+    return large_trades, grouped
 
 
 # =========================================================================
@@ -123,7 +214,7 @@ def fetch_recent_large_trades(cfg: dict) -> list[dict]:
 # =========================================================================
 
 def detect_whale_convergence(
-    trades: list[dict],
+    trades: list[dict] | dict[tuple, list[dict]],
     cfg: dict,
 ) -> list[Opportunity]:
     """
@@ -132,6 +223,7 @@ def detect_whale_convergence(
 
     If N+ unique wallets all BUY (or all SELL) on the same market within
     the convergence window → strong directional signal.
+    Accepts a flat trade list or the pre-grouped dict from fetch_grouped_large_trades.
     """
     whale_cfg = cfg.get("whales", {})
     convergence_count = whale_cfg.get("convergence_count", 3)
@@ -142,41 +234,52 @@ def detect_whale_convergence(
 
     opportunities = []
 
-    # Group trades by (market_id/conditionId, side)
-    grouped: dict[tuple, list[dict]] = defaultdict(list)
-    for t in trades:
-        key = (t["market_id"], t["side"])
-        grouped[key].append(t)
+    # Group trades by (market_id/conditionId, side) unless the fetch already did
+    if isinstance(trades, dict):
+        grouped = trades
+    else:
+        grouped = defaultdict(list)
+        for t in trades:
+            key = (t["market_id"], t["side"])
+            grouped[key].append(t)
+
+    window_s = window_min * 60
 
     for (market_id, side), market_trades in grouped.items():
-        # Get unique wallets
-        unique_wallets = set()
-        total_value = 0
-        avg_price = 0
-        latest_time = None
         title = market_trades[0]["title"]
         url = market_trades[0]["url"]
+
+        # Single pass: wallets, totals and the time span together.
+        # All trades must fall within convergence_window_min — bail as soon as the span exceeds it.
+        unique_wallets = set()
+        total_value = 0
+        price_sum = 0
         pseudonyms = []
+        min_ts = max_ts = market_trades[0]["ts"]
+        too_wide = False
 
         for t in market_trades:
+            ts = t["ts"]
+            if ts < min_ts:
+                min_ts = ts
+            elif ts > max_ts:
+                max_ts = ts
+            if max_ts - min_ts > window_s:
+                too_wide = True
+                break
             wallet = t["maker"]
             if wallet and wallet != "unknown":
                 unique_wallets.add(wallet)
             total_value += t["value"]
-            avg_price += t["price"]
-            if latest_time is None or t["timestamp"] > latest_time:
-                latest_time = t["timestamp"]
+            price_sum += t["price"]
             if t.get("pseudonym"):
                 pseudonyms.append(t["pseudonym"])
 
-        avg_price = avg_price / len(market_trades) if market_trades else 0
+        if too_wide:
+            continue
 
-        # Check time window — all trades within convergence_window_min
-        if len(market_trades) >= 2:
-            timestamps = [t["timestamp"] for t in market_trades]
-            time_span = (max(timestamps) - min(timestamps)).total_seconds() / 60
-            if time_span > window_min:
-                continue
+        avg_price = price_sum / len(market_trades)
+        latest_time = datetime.fromtimestamp(max_ts, tz=timezone.utc)  # Only datetime built per group
 
         # Check convergence threshold
         if len(unique_wallets) < convergence_count:
@@ -244,8 +347,8 @@ def find_whale_opportunities(cfg: dict) -> list[Opportunity]:
 
     logger.info("Scanning for whale convergence signals...")
 
-    # Fetch large trades from public Data API
-    trades = fetch_recent_large_trades(cfg)
+    # Fetch large trades from public Data API, already bucketed by (market, side)
+    trades = fetch_grouped_large_trades(cfg)
 
     if not trades:
         logger.info("No large trades found in lookback window")
@@ -10,57 +10,357 @@ Tracks whale wallets across scan cycles and builds a performance database:
 This data feeds into the Edge Score for whale-based signals and
 provides a "Smart Money" filter — only copy whales with proven track records.
 
-Storage: JSON file (portable) with periodic compaction.
+Storage: gzipped JSON shard files (portable), one per address prefix, so a save
+only rewrites shards holding changed wallets. Periodic compaction.
 """
+import re
+import sys
+import gzip
 import json
+import heapq
+import hashlib
+import zlib
+import math
 import time
+import atexit
 import logging
 import os
 import requests
-from collections import defaultdict
+import numpy as np
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from datetime import datetime, timezone
+# Fast JSON encode/decode for the full vault — graceful fallback to stdlib
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger("arb_bot.whale_vault")
 
+# Keep-alive session shared by every vault instance: the leaderboard endpoints
+# reuse one pooled connection instead of a fresh TCP+TLS handshake per request.
+# Reads aren't retried so the short timeouts below stay the worst case.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=2,
+    pool_maxsize=4,
+    max_retries=Retry(total=2, read=0, backoff_factor=0.3, status_forcelist=[500, 502, 503, 504]),
+))
+_SESSION.headers.update({"Accept": "application/json"})
+atexit.register(_SESSION.close)
+
+# Leaderboard endpoints are probed concurrently (see fetch_leaderboard)
+_LB_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="leaderboard")
+
+# (period, category) → (fetched_at, whales). Module-level so the throwaway vaults
+# /topwhales builds share it; back-to-back commands reuse one API response.
+LEADERBOARD_CACHE_TTL = 300
+_lb_cache: dict[tuple[str, str], tuple[float, list[dict]]] = {}
+
+# Scores also drift with wall-clock time (activity span, 30-day recency decay), so a
+# cached score is reused only while the wallet is unchanged and for at most this long
+SCORE_CACHE_TTL = 300
+
+# Minimum seconds between batch-triggered shard writes, unless this
+# many wallets have unsaved changes — then a busy batch is flushed right away
+SAVE_INTERVAL = 60
+SAVE_DIRTY_MAX = 200
+
+# Specialty categories, matched as substrings of the lowercased title. The lookahead
+# finds overlapping hits so one regex pass matches exactly what six `in` checks would.
+_CATEGORIES = ("crypto", "politics", "sports", "tech", "finance", "entertainment")
+_CATEGORY_RE = re.compile(r"(?=(" + "|".join(_CATEGORIES) + r"))")
+
+# Per-wallet ring buffers: deque(maxlen) drops the oldest entry in O(1) on append
+TRADE_HISTORY_LEN = 50
+PENDING_LEN = 20
+
+
+@lru_cache(maxsize=4096)
+def _title_categories(title: str) -> tuple[str, ...]:
+    """
+    Categories named in a market title. Many whales hit the same market, so
+    repeat titles skip the lowercase + regex pass. Fixed category order keeps
+    insertion order (and specialty tie-breaks) unchanged.
+    """
+    found = _CATEGORY_RE.findall(title.lower())
+    if not found:
+        return ()
+    found = set(found)
+    return tuple(c for c in _CATEGORIES if c in found)
+
+
+def _intern(s):
+    """sys.intern for strings; the same address, pseudonym, side and market title
+    recur across many wallets and trades, so one shared copy each saves memory."""
+    return sys.intern(s) if type(s) is str else s
+
+
+def _new_wallet(now: float, pseudonym: str = "", total_volume: float = 0.0) -> dict:
+    """Fresh wallet profile with empty ring buffers."""
+    return {
+        "first_seen": now,
+        "total_trades": 0,
+        "total_volume": total_volume,
+        "trade_history": deque(maxlen=TRADE_HISTORY_LEN),  # Last 50 trades
+        "categories": {},     # Category → count
+        "pseudonym": pseudonym,
+        "win_count": 0,
+        "loss_count": 0,
+        "pending": deque(maxlen=PENDING_LEN),  # Trades awaiting resolution
+    }
+
+
+def _json_default(obj):
+    """Serialize the ring buffers as plain lists; anything else falls back to str."""
+    if isinstance(obj, deque):
+        return list(obj)
+    return str(obj)
+
+
+# Shards are gzipped: repetitive JSON shrinks several-fold, and level 1 costs
+# little more than the copy. Plain .json shards from before still load.
+SHARD_SUFFIX = ".json.gz"
+_SHARD_SUFFIXES = (".json", SHARD_SUFFIX)
+_LOAD_ERRORS = (json.JSONDecodeError, IOError, EOFError, zlib.error)
+
+
+def _shard_key(addr: str) -> str:
+    """Shard file name for a wallet: the two hex digits after "0x" (≤ 256 shards)."""
+    key = (addr[2:4] if addr[:2].lower() == "0x" else addr[:2]).lower()
+    return key if key.isascii() and key.isalnum() else "_"
+
+
+def _encode(data: dict) -> bytes:
+    if orjson:
+        return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, separators=(",", ":"), default=_json_default).encode()
+
+
+def _read_wallets(path: str) -> dict:
+    """The "wallets" mapping of one vault/shard file, gzipped or plain."""
+    with open(path, "rb") as f:
+        raw = f.read()
+    if raw[:2] == b"\x1f\x8b":
+        raw = gzip.decompress(raw)
+    data = orjson.loads(raw) if orjson else json.loads(raw)
+    return data.get("wallets", {})
+
+
+def _write_atomic(path: str, payload: bytes):
+    """Temp file + fsync + os.replace; the temp file is removed if anything fails."""
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())  # Saves are debounced, so durability is cheap here
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def _fetch_leaderboard_url(url: str, period: str) -> list[dict]:
+    """One leaderboard endpoint, normalized; [] if it fails or has no usable rows."""
+    try:
+        resp = _SESSION.get(url, timeout=3)
+        if resp.status_code != 200:
+            return []
+        data = resp.json()
+        if isinstance(data, list):
+            entries = data
+        elif isinstance(data, dict):
+            entries = (
+                data.get("leaderboard")
+                or data.get("data")
+                or data.get("results")
+                or []
+            )
+        else:
+            return []
+
+        whales = []
+        for i, entry in enumerate(entries[:50]):
+            addr = (
+                entry.get("address")
+                or entry.get("proxyWallet")
+                or entry.get("wallet", "")
+            )
+            if not addr:
+                continue
+            pnl_raw = entry.get("pnl", entry.get("profit", 0)) or 0
+            wr_raw = entry.get("winRate", entry.get("win_rate", 0)) or 0
+            whales.append({
+                "address": addr,
+                "pnl": float(pnl_raw),
+                "volume": float(entry.get("volume", 0) or 0),
+                "win_rate": float(wr_raw) * (1 if float(wr_raw) > 1 else 100),
+                "rank": entry.get("rank", i + 1),
+                "pseudonym": entry.get("name", entry.get("pseudonym", "")),
+                "period": period,
+            })
+        return whales
+
+    except requests.RequestException as e:
+        logger.debug(f"Leaderboard endpoint failed: {e}")
+        return []
+
+
+# Inputs at which the log-scaled sub-scores saturate at 100 — past these, skip the log
+_VOL_SCORE_SATURATION = 500 * math.expm1(100 / 15)    # ≈ $392K
+_FREQ_SCORE_SATURATION = math.expm1(100 / 20)          # ≈ 147 trades
+
+_DAY_S = 86400.0
+_INV_DAY_S = 1.0 / _DAY_S
+_INV_RECENCY_S = 1.0 / (30 * _DAY_S)  # Recency decays to 0 over 30 days
+
+# Column-wise scores are unrounded and may be up to SCORE_CACHE_TTL old; anything this
+# far below a cut-off can't reach it after rounding (±0.05) and that much clock drift
+_SHORTLIST_MARGIN = 0.2
+
 
 class WhaleVault:
     """Persistent vault for whale wallet performance data."""
 
     def __init__(self, vault_path: str = "whale_vault.json"):
+        # vault_path is the legacy single-file vault; wallets now live in per-prefix
+        # shard files under vault_dir, and an existing vault_path is migrated once
         self.vault_path = vault_path
+        self.vault_dir = os.path.splitext(vault_path)[0] + "_shards"
         self.wallets: dict[str, dict] = {}
+        # address → (fingerprint, computed_at, score dict); dropped whenever the wallet changes
+        self._score_cache: dict[str, tuple[tuple, float, dict]] = {}
+        # Wallets changed or removed since their shard was written; flushed by _maybe_save and at exit
+        self._dirty: set[str] = set()
+        self._last_save = 0.0
+        self._flush_at_exit = False
+        # Sum of total_volume over all wallets, kept current by every mutator
+        self._total_volume = 0.0
+        # (built_at, addrs, positions best-first, scores best-first); None after any change
+        self._score_index: tuple[float, list[str], np.ndarray, np.ndarray] | None = None
+        # period → digest of the last merged leaderboard, to skip no-op merges
+        self._lb_digest: dict[str, bytes] = {}
         self._load()
 
     # ------------------------------------------------------------------
     # Persistence
     # ------------------------------------------------------------------
     def _load(self):
-        """Load wallet data from disk."""
-        if os.path.exists(self.vault_path):
+        """Load wallet data from disk: the legacy single file and/or every shard file."""
+        self.wallets = {}
+        has_legacy = os.path.exists(self.vault_path)
+        if not has_legacy and not os.path.isdir(self.vault_dir):
+            logger.info("Whale Vault: starting fresh (no existing data)")
+            return
+
+        # The legacy file outlives the shard dir only when a migration didn't finish:
+        # read it first so wallets from shards that never got written aren't lost
+        legacy_ok = False
+        if has_legacy:
             try:
-                with open(self.vault_path, "r") as f:
-                    data = json.load(f)
-                self.wallets = data.get("wallets", {})
-                logger.info(f"Whale Vault loaded: {len(self.wallets)} wallets tracked")
-            except (json.JSONDecodeError, IOError) as e:
+                self.wallets = _read_wallets(self.vault_path)
+                legacy_ok = True
+            except _LOAD_ERRORS as e:
                 logger.warning(f"Whale Vault load error: {e}")
                 self.wallets = {}
-        else:
-            self.wallets = {}
-            logger.info("Whale Vault: starting fresh (no existing data)")
-
-    def save(self):
-        """Save wallet data to disk."""
+        if os.path.isdir(self.vault_dir):
+            # Sorted, so a shard's .json.gz (newer) is applied after any stale .json
+            for name in sorted(os.listdir(self.vault_dir)):
+                if not name.endswith(_SHARD_SUFFIXES):
+                    continue
+                try:
+                    self.wallets.update(_read_wallets(os.path.join(self.vault_dir, name)))
+                except _LOAD_ERRORS as e:
+                    # One bad shard only costs the wallets in it
+                    logger.warning(f"Whale Vault shard {name} load error: {e}")
+
+        # Decoding gives every repeat of an address/title its own string; share them
+        self.wallets = {_intern(addr): w for addr, w in self.wallets.items()}
+        for w in self.wallets.values():
+            w["trade_history"] = deque(w.get("trade_history", ()), maxlen=TRADE_HISTORY_LEN)
+            w["pending"] = deque(w.get("pending", ()), maxlen=PENDING_LEN)
+            w["pseudonym"] = _intern(w.get("pseudonym", ""))
+            for rec in chain(w["trade_history"], w["pending"]):
+                for key in ("title", "side"):
+                    if key in rec:
+                        rec[key] = _intern(rec[key])
+        self._total_volume = sum(w.get("total_volume", 0) for w in self.wallets.values())
+        logger.info(f"Whale Vault loaded: {len(self.wallets)} wallets tracked")
+
+        if legacy_ok and self.wallets:
+            # One-time migration (or a retry of a partial one): write every shard,
+            # and retire the single file only once all of them made it to disk
+            self._dirty.update(self.wallets)
+            if self.save():
+                try:
+                    os.remove(self.vault_path)
+                    logger.info(f"Whale Vault migrated to shards in {self.vault_dir}")
+                except OSError as e:
+                    logger.warning(f"Whale Vault legacy file cleanup error: {e}")
+
+    def save(self) -> bool:
+        """Save changed wallets to disk; True if every pending shard was written.
+        Only shards holding a dirty (changed or removed) wallet are rewritten.
+        Each goes to a temp file swapped in with os.replace, so a crash
+        mid-write leaves the previous shard intact instead of a truncated file.
+        """
+        dirty_by_shard: dict[str, list[str]] = defaultdict(list)
+        for addr in list(self._dirty):
+            dirty_by_shard[_shard_key(addr)].append(addr)
+        shards: dict[str, dict] = {key: {} for key in dirty_by_shard}
+        for addr, w in list(self.wallets.items()):
+            bucket = shards.get(_shard_key(addr))
+            if bucket is not None:
+                bucket[addr] = w
+
+        ok = True
+        updated_at = datetime.now(timezone.utc).isoformat()
         try:
-            data = {
-                "wallets": self.wallets,
-                "updated_at": datetime.now(timezone.utc).isoformat(),
-                "total_wallets": len(self.wallets),
-            }
-            with open(self.vault_path, "w") as f:
-                json.dump(data, f, indent=2, default=str)
-        except IOError as e:
+            os.makedirs(self.vault_dir, exist_ok=True)
+        except OSError as e:
             logger.error(f"Whale Vault save error: {e}")
+            return False
+        for key, wallets in shards.items():
+            path = os.path.join(self.vault_dir, key + SHARD_SUFFIX)
+            plain_path = os.path.join(self.vault_dir, key + ".json")
+            try:
+                if wallets:
+                    payload = _encode({"wallets": wallets, "updated_at": updated_at})
+                    _write_atomic(path, gzip.compress(payload, compresslevel=1, mtime=0))
+                elif os.path.exists(path):
+                    os.remove(path)  # Every wallet in it was compacted away
+                if os.path.exists(plain_path):
+                    os.remove(plain_path)  # Superseded by the gzipped shard
+            except (IOError, TypeError) as e:
+                logger.error(f"Whale Vault save error (shard {key}): {e}")
+                ok = False
+                continue  # Stays dirty; retried on the next save
+            self._dirty.difference_update(dirty_by_shard[key])
+        self._last_save = time.time()
+        return ok
+
+    def flush(self):
+        """Save only if there are unsaved trade records."""
+        if self._dirty:
+            self.save()
+
+    def _maybe_save(self):
+        """Coalesce batch saves: write dirty shards once per SAVE_INTERVAL, or
+        sooner once SAVE_DIRTY_MAX wallets are waiting."""
+        if not self._dirty:
+            return
+        if (len(self._dirty) >= SAVE_DIRTY_MAX
+                or time.time() - self._last_save >= SAVE_INTERVAL):
+            self.save()
 
     # ------------------------------------------------------------------
     # Wallet Tracking
@@ -74,64 +374,58 @@ class WhaleVault:
         wallet = trade.get("maker", "")
         if not wallet or wallet == "unknown":
             return
+        wallet = _intern(wallet)
 
         now = time.time()
 
         if wallet not in self.wallets:
-            self.wallets[wallet] = {
-                "first_seen": now,
-                "total_trades": 0,
-                "total_volume": 0.0,
-                "trade_history": [],  # Last 50 trades
-                "categories": {},     # Category → count
-                "pseudonym": trade.get("pseudonym", ""),
-                "win_count": 0,
-                "loss_count": 0,
-                "pending": [],        # Trades awaiting resolution
-            }
+            self.wallets[wallet] = _new_wallet(now, trade.get("pseudonym", ""))
 
         w = self.wallets[wallet]
+        self._score_cache.pop(wallet, None)
+        self._score_index = None
+        self._dirty.add(wallet)
+        if not self._flush_at_exit:
+            atexit.register(self.flush)  # Don't lose a coalesced batch on shutdown
+            self._flush_at_exit = True
         w["total_trades"] += 1
-        w["total_volume"] += trade.get("value", 0)
+        value = trade.get("value", 0)
+        w["total_volume"] += value
+        self._total_volume += value
         w["last_seen"] = now
 
         if trade.get("pseudonym"):
-            w["pseudonym"] = trade["pseudonym"]
+            w["pseudonym"] = _intern(trade["pseudonym"])
 
         # Track category specialty
-        title = trade.get("title", "").lower()
-        for cat_name in ["crypto", "politics", "sports", "tech", "finance", "entertainment"]:
-            if cat_name in title:
-                w["categories"][cat_name] = w["categories"].get(cat_name, 0) + 1
+        for cat_name in _title_categories(trade.get("title", "")):
+            w["categories"][cat_name] = w["categories"].get(cat_name, 0) + 1
 
         # Store recent trade (keep last 50)
+        title = _intern(trade.get("title", "")[:80])
+        side = _intern(trade.get("side", ""))
         trade_record = {
             "ts": now,
-            "title": trade.get("title", "")[:80],
-            "side": trade.get("side", ""),
+            "title": title,
+            "side": side,
             "price": trade.get("price", 0),
             "value": trade.get("value", 0),
         }
         w["trade_history"].append(trade_record)
-        if len(w["trade_history"]) > 50:
-            w["trade_history"] = w["trade_history"][-50:]
 
         # Add to pending for resolution tracking
         w["pending"].append({
             "ts": now,
-            "title": trade.get("title", "")[:80],
-            "side": trade.get("side", ""),
+            "title": title,
+            "side": side,
             "price": trade.get("price", 0),
         })
-        if len(w["pending"]) > 20:
-            w["pending"] = w["pending"][-20:]
 
     def record_trades_batch(self, trades: list[dict]):
-        """Record multiple trades and save."""
+        """Record multiple trades; saved by _maybe_save (and at exit)."""
         for t in trades:
             self.record_trade(t)
-        if trades:
-            self.save()
+        self._maybe_save()
 
     # ------------------------------------------------------------------
     # Wallet Scoring
@@ -156,6 +450,15 @@ class WhaleVault:
             }
 
         now = time.time()
+        # Everything the score reads besides the clock — a direct edit to any of
+        # these (not just record_trade) invalidates the cached score
+        fingerprint = (
+            w.get("last_seen"), w.get("total_trades"), w.get("total_volume"),
+            w.get("win_count"), w.get("loss_count"),
+        )
+        cached = self._score_cache.get(wallet_address)
+        if cached and cached[0] == fingerprint and now - cached[1] < SCORE_CACHE_TTL:
+            return dict(cached[2])  # Copy: callers decorate the result
         total_trades = w.get("total_trades", 0)
         total_volume = w.get("total_volume", 0)
         first_seen = w.get("first_seen", now)
@@ -167,16 +470,21 @@ class WhaleVault:
         # --- Sub-scores ---
         # Volume score: More volume = more conviction
         # $1K → 20, $10K → 40, $100K → 60, $1M → 80
-        import math
-        vol_score = min(100, 15 * math.log(max(1, total_volume) / 500 + 1))
+        if total_volume >= _VOL_SCORE_SATURATION:
+            vol_score = 100
+        else:
+            vol_score = min(100, 15.0 * math.log1p(max(1.0, total_volume) * 0.002))
 
         # Trade frequency: More trades = more data = more reliable
         # 1 → 10, 5 → 30, 10 → 50, 50 → 80
-        freq_score = min(100, 20 * math.log(max(1, total_trades) + 1))
+        if total_trades >= _FREQ_SCORE_SATURATION:
+            freq_score = 100
+        else:
+            freq_score = min(100, 20.0 * math.log1p(max(1, total_trades)))
 
         # Consistency: How long they've been active
-        days_active = max(1, (now - first_seen) / 86400)
-        recency = max(0, 1 - (now - last_seen) / (30 * 86400))  # Decay over 30 days
+        days_active = max(1, (now - first_seen) * _INV_DAY_S)
+        recency = max(0, 1 - (now - last_seen) * _INV_RECENCY_S)  # Decay over 30 days
         consistency = min(100, days_active * 5) * recency
 
         # Win rate (if we have resolution data)
@@ -200,7 +508,7 @@ class WhaleVault:
             + win_score * 0.30
         )
 
-        return {
+        result = {
             "score": round(score, 1),
             "total_trades": total_trades,
             "total_volume": round(total_volume, 2),
@@ -210,11 +518,69 @@ class WhaleVault:
             "pseudonym": w.get("pseudonym", ""),
             "win_rate": round(wins / total_resolved * 100, 1) if total_resolved >= 5 else None,
         }
+        self._score_cache[wallet_address] = (fingerprint, now, result)
+        return dict(result)
+
+    def _approx_scores(self) -> tuple[list[str], np.ndarray]:
+        """
+        score_wallet's formula evaluated over all wallets at once as NumPy
+        columns. Used to shortlist candidates so only those pay for exact,
+        per-wallet scoring.
+        """
+        now = time.time()
+        addrs = list(self.wallets)
+        ws = self.wallets.values()
+        count = len(addrs)
+
+        def col(key, default):
+            return np.fromiter((w.get(key, default) for w in ws), dtype=float, count=count)
+
+        vol = col("total_volume", 0)
+        trades = col("total_trades", 0)
+        first_seen = col("first_seen", now)
+        last_seen = col("last_seen", now)
+        wins = col("win_count", 0)
+        losses = col("loss_count", 0)
+
+        vol_score = np.minimum(100, 15.0 * np.log1p(np.maximum(1.0, vol) * 0.002))
+        freq_score = np.minimum(100, 20.0 * np.log1p(np.maximum(1, trades)))
+        days_active = np.maximum(1, (now - first_seen) * _INV_DAY_S)
+        recency = np.maximum(0, 1 - (now - last_seen) * _INV_RECENCY_S)
+        consistency = np.minimum(100, days_active * 5) * recency
+        resolved = wins + losses
+        win_score = np.where(resolved >= 5, wins / np.maximum(resolved, 1) * 100, 50)
+
+        score = vol_score * 0.25 + freq_score * 0.25 + consistency * 0.20 + win_score * 0.30
+        return addrs, score
+
+    def _ranked(self) -> tuple[list[str], np.ndarray, np.ndarray]:
+        """
+        Wallets ordered best-first by approximate score. Scores drift with the
+        clock, so rather than maintaining the order per update it is rebuilt
+        lazily: after any vault change or once SCORE_CACHE_TTL has passed.
+        """
+        now = time.time()
+        idx = self._score_index
+        if idx is None or now - idx[0] >= SCORE_CACHE_TTL:
+            addrs, approx = self._approx_scores()
+            order = np.argsort(-approx, kind="stable")
+            idx = self._score_index = (now, addrs, order, approx[order])
+        return idx[1], idx[2], idx[3]
+
+    def _shortlist(self, cutoff: float) -> list[str]:
+        """Wallets whose approximate score is within the margin of cutoff, in vault order."""
+        addrs, order, best_first = self._ranked()
+        k = np.searchsorted(-best_first, _SHORTLIST_MARGIN - cutoff, side="right")
+        # Vault order so equal scores tie-break exactly as a full sort would
+        return [addrs[i] for i in np.sort(order[:k])]
 
     def get_top_wallets(self, n: int = 10) -> list[dict]:
         """Get the top N wallets by score."""
+        addrs = self.wallets
+        if 0 < n < len(self.wallets):
+            addrs = self._shortlist(self._ranked()[2][n - 1])
         scored = []
-        for addr in self.wallets:
+        for addr in addrs:
             info = self.score_wallet(addr)
             info["address"] = addr[:8] + "..." + addr[-4:] if len(addr) > 12 else addr
             info["full_address"] = addr
@@ -226,7 +592,7 @@ class WhaleVault:
     def get_smart_money_wallets(self) -> list[str]:
         """Get wallet addresses with score >= 75."""
         return [
-            addr for addr in self.wallets
+            addr for addr in self._shortlist(75)
             if self.score_wallet(addr)["is_smart_money"]
         ]
 
@@ -246,7 +612,7 @@ class WhaleVault:
 
         top = self.get_top_wallets(5)
         smart_count = len(self.get_smart_money_wallets())
-        total_volume = sum(w.get("total_volume", 0) for w in self.wallets.values())
+        total_volume = self._total_volume
 
         msg = (
             f"🐋 <b>WHALE VAULT</b>\n"
@@ -278,18 +644,24 @@ class WhaleVault:
     # Compaction (cleanup old data)
     # ------------------------------------------------------------------
     def compact(self, max_age_days: int = 90):
-        """Remove wallets not seen in max_age_days."""
+        """Remove wallets not seen in max_age_days (trading or on the leaderboard)."""
         now = time.time()
-        cutoff = now - (max_age_days * 86400)
-        before = len(self.wallets)
-        self.wallets = {
-            addr: w for addr, w in self.wallets.items()
-            if w.get("last_seen", 0) > cutoff
-        }
-        removed = before - len(self.wallets)
-        if removed:
-            logger.info(f"Whale Vault compacted: removed {removed} stale wallets")
-            self.save()
+        cutoff = now - (max_age_days * _DAY_S)
+        # Read-only scan first; nothing stale → no rebuild, no save.
+        # Leaderboard-only wallets have no last_seen — their merge time counts as activity
+        stale = [
+            addr for addr, w in self.wallets.items()
+            if max(w.get("last_seen", 0), w.get("leaderboard_updated", 0)) <= cutoff
+        ]
+        if not stale:
+            return
+        for addr in stale:
+            self._total_volume -= self.wallets.pop(addr).get("total_volume", 0)
+            self._score_cache.pop(addr, None)
+        self._dirty.update(stale)  # Their shards are rewritten without them
+        self._score_index = None
+        logger.info(f"Whale Vault compacted: removed {len(stale)} stale wallets")
+        self.save()
 
     # ------------------------------------------------------------------
     # Official Leaderboard Integration (Strand.trade parity)
@@ -299,7 +671,14 @@ class WhaleVault:
         Fetch Polymarket's public leaderboard via data-api.
         Uses short timeouts (3s) so it never hangs.
         Falls back to vault-tracked wallets if API is unavailable.
+        API results are reused for LEADERBOARD_CACHE_TTL seconds; treat the
+        returned list as read-only.
         """
+        key = (period, category)
+        hit = _lb_cache.get(key)
+        if hit and time.time() - hit[0] < LEADERBOARD_CACHE_TTL:
+            return hit[1]  # Shared with the cache: callers only read it
+
         # Map period to API window param
         window_map = {"1d": "day", "7d": "week", "30d": "month", "all": "all"}
         window = window_map.get(period, "month")
@@ -309,55 +688,18 @@ class WhaleVault:
             f"https://data-api.polymarket.com/leaderboard?limit=50",
         ]
 
-        for url in endpoints_to_try:
-            try:
-                resp = requests.get(
-                    url, timeout=3,
-                    headers={"Accept": "application/json"}
-                )
-                if resp.status_code != 200:
-                    continue
-                data = resp.json()
-                if isinstance(data, list):
-                    entries = data
-                elif isinstance(data, dict):
-                    entries = (
-                        data.get("leaderboard")
-                        or data.get("data")
-                        or data.get("results")
-                        or []
-                    )
-                else:
-                    continue
-
-                whales = []
-                for i, entry in enumerate(entries[:50]):
-                    addr = (
-                        entry.get("address")
-                        or entry.get("proxyWallet")
-                        or entry.get("wallet", "")
-                    )
-                    if not addr:
-                        continue
-                    pnl_raw = entry.get("pnl", entry.get("profit", 0)) or 0
-                    wr_raw = entry.get("winRate", entry.get("win_rate", 0)) or 0
-                    whales.append({
-                        "address": addr,
-                        "pnl": float(pnl_raw),
-                        "volume": float(entry.get("volume", 0) or 0),
-                        "win_rate": float(wr_raw) * (1 if float(wr_raw) > 1 else 100),
-                        "rank": entry.get("rank", i + 1),
-                        "pseudonym": entry.get("name", entry.get("pseudonym", "")),
-                        "period": period,
-                    })
-
-                if whales:
-                    logger.info(f"🏆 Leaderboard: {len(whales)} whales ({period})")
-                    return whales
-
-            except requests.RequestException as e:
-                logger.debug(f"Leaderboard endpoint failed: {e}")
-                continue
+        # Probe all endpoints at once, but take results in preference order: the
+        # windowed one wins if it answers, and a slow failure there no longer
+        # delays the fallback by its full timeout
+        futures = [_LB_POOL.submit(_fetch_leaderboard_url, url, period) for url in endpoints_to_try]
+        for fut in futures:
+            whales = fut.result()
+            if whales:
+                for other in futures:
+                    other.cancel()
+                logger.info(f"🏆 Leaderboard: {len(whales)} whales ({period})")
+                _lb_cache[key] = (time.time(), whales)
+                return whales
 
         # API unavailable — build from vault data
         logger.info("Leaderboard API unavailable, using vault data")
@@ -372,34 +714,35 @@ class WhaleVault:
         leaderboard = self.fetch_leaderboard(period)
         if not leaderboard:
             return 0
+        # Same payload as the last merge → nothing would change but the timestamps
+        digest = hashlib.blake2b(_encode({"lb": leaderboard}), digest_size=16).digest()
+        if self._lb_digest.get(period) == digest:
+            logger.info(f"🏆 Leaderboard unchanged ({period}) — skipping merge")
+            return 0
+        self._lb_digest[period] = digest
 
         merged = 0
         now = time.time()
         for entry in leaderboard:
-            addr = entry["address"]
+            addr = _intern(entry["address"])
             # Create wallet entry if not seen yet
             if addr not in self.wallets:
-                self.wallets[addr] = {
-                    "first_seen": now,
-                    "total_trades": 0,
-                    "total_volume": entry["volume"],
-                    "trade_history": [],
-                    "categories": {},
-                    "pseudonym": entry.get("pseudonym", ""),
-                    "win_count": 0,
-                    "loss_count": 0,
-                    "pending": [],
-                }
+                self.wallets[addr] = _new_wallet(now, _intern(entry.get("pseudonym", "")), entry["volume"])
+                self._total_volume += entry["volume"]
             w = self.wallets[addr]
+            self._score_cache.pop(addr, None)
+            self._score_index = None
+            self._dirty.add(addr)
             # Enrich with official leaderboard data
             w[f"pnl_{period}"] = entry["pnl"]
             w[f"win_rate_{period}"] = entry["win_rate"]
             w[f"rank_{period}"] = entry["rank"]
             w["leaderboard_updated"] = now
             if entry.get("pseudonym") and not w.get("pseudonym"):
-                w["pseudonym"] = entry["pseudonym"]
+                w["pseudonym"] = _intern(entry["pseudonym"])
             # Boost volume if leaderboard data is larger
             if entry["volume"] > w.get("total_volume", 0):
+                self._total_volume += entry["volume"] - w.get("total_volume", 0)
                 w["total_volume"] = entry["volume"]
             merged += 1
 
@@ -439,25 +782,28 @@ class WhaleVault:
         Format top whales for Telegram /topwhales command.
         Combines live leaderboard data with vault intelligence.
         """
-        # Find wallets that have leaderboard rank data
-        ranked = []
-        for addr, w in self.wallets.items():
-            rank = w.get(f"rank_{period}")
-            pnl = w.get(f"pnl_{period}", 0)
-            win_rate = w.get(f"win_rate_{period}", 0)
-            if rank is not None:
-                vault_score = self.score_wallet(addr)["score"]
-                ranked.append({
-                    "address": addr,
-                    "rank": rank,
-                    "pnl": pnl,
-                    "win_rate": win_rate,
-                    "pseudonym": w.get("pseudonym", ""),
-                    "vault_score": vault_score,
-                    "total_trades": w.get("total_trades", 0),
-                })
-
-        if not ranked:
+        # Wallets that have leaderboard rank data: heap-select the 10 best ranks
+        # (stable, same order as a full sort) and only score those
+        rank_key = f"rank_{period}"
+        best = heapq.nsmallest(
+            10,
+            ((addr, w) for addr, w in self.wallets.items() if w.get(rank_key) is not None),
+            key=lambda item: item[1][rank_key],
+        )
+        top = [
+            {
+                "address": addr,
+                "rank": w[rank_key],
+                "pnl": w.get(f"pnl_{period}", 0),
+                "win_rate": w.get(f"win_rate_{period}", 0),
+                "pseudonym": w.get("pseudonym", ""),
+                "vault_score": self.score_wallet(addr)["score"],
+                "total_trades": w.get("total_trades", 0),
+            }
+            for addr, w in best
+        ]
+
+        if not top:
             # No cached data — fetch fresh
             live = self.fetch_leaderboard(period)
             if not live:
@@ -466,10 +812,7 @@ class WhaleVault:
                     "━━━━━━━━━━━━━━━━━━━━━━━━\n"
                     "Leaderboard unavailable. Vault builds as bot scans."
                 )
-            ranked = live
-
-        ranked.sort(key=lambda x: x.get("rank", 999))
-        top = ranked[:10]
+            top = heapq.nsmallest(10, live, key=lambda x: x.get("rank", 999))
 
         msg = (
             f"🏆 <b>TOP PERFORMING WHALES ({period.upper()})</b>\n"